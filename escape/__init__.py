@@ -8,8 +8,6 @@ structure that mirrors the game's interface.
 __version__ = "2.2.1"
 __author__ = "Escape Team"
 
-# Ensure generated files path is available for imports
-
 from escape.client import Client
 
 __all__ = ["Client"]
@@ -14,7 +14,7 @@ from escape.types import ItemContainer
 
 # Skill names constant - defined here to avoid circular import with tabs.skills
 # Note: Also defined in tabs/skills.py for public API access
-SKILL_NAMES = [
+SKILL_NAMES = (
     "Attack",
     "Defence",
     "Strength",
@@ -39,7 +39,7 @@ SKILL_NAMES = [
     "Hunter",
     "Construction",
     "Sailing",
-]
+)
 
 
 class StateBuilder:
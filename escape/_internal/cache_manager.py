@@ -1,9 +1,11 @@
 """Centralized cache management for Escape using ~/.cache/escape/."""
 
+import contextlib
 import gzip
 import json
 import os
 import shutil
+import sqlite3
 import sys
 import urllib.request
 import zipfile
@@ -233,6 +235,119 @@ def _needs_update(cache_dir: Path) -> bool:
     return False
 
 
+# Bump when the derived tables built by _prepare_objects_db change so cached databases rebuild
+_OBJECTS_DB_SCHEMA = 4
+
+
+def _prepare_objects_db(db_conn: sqlite3.Connection) -> None:
+    """Build the indexes and derived tables the objects accessors rely on (once per download)."""
+    (version,) = db_conn.execute("PRAGMA user_version").fetchone()
+    if version >= _OBJECTS_DB_SCHEMA:
+        return
+
+    logger.info("Building objects database indexes")
+
+    # Denormalized read tables: names are joined in once here instead of on every query,
+    # and action slots are pivoted into one row per object
+    db_conn.executescript(
+        """
+        BEGIN;
+        DROP INDEX IF EXISTS idx_obj_coord_nameid;
+        DROP TABLE IF EXISTS objects_wide;
+        CREATE TABLE objects_wide AS
+            SELECT o.object_id, o.coord, n.name
+            FROM objects o
+            LEFT JOIN names n ON o.name_id = n.id;
+        CREATE INDEX idx_objw_object_id ON objects_wide(object_id, coord, name);
+        CREATE INDEX idx_objw_name ON objects_wide(name, object_id);
+        CREATE INDEX idx_objw_coord ON objects_wide(coord, object_id, name);
+
+        DROP TABLE IF EXISTS object_action_slots_wide;
+        CREATE TABLE object_action_slots_wide AS
+            SELECT w.object_id, w.name, p.slot0, p.slot1, p.slot2, p.slot3, p.slot4
+            FROM (SELECT DISTINCT object_id, name FROM objects_wide) w
+            JOIN (
+                SELECT object_id,
+                       MAX(CASE WHEN slot = 0 THEN action END) AS slot0,
+                       MAX(CASE WHEN slot = 1 THEN action END) AS slot1,
+                       MAX(CASE WHEN slot = 2 THEN action END) AS slot2,
+                       MAX(CASE WHEN slot = 3 THEN action END) AS slot3,
+                       MAX(CASE WHEN slot = 4 THEN action END) AS slot4
+                FROM object_action_slots
+                GROUP BY object_id
+            ) p ON p.object_id = w.object_id;
+        CREATE INDEX idx_oasw_object_id ON object_action_slots_wide(object_id);
+        CREATE INDEX IF NOT EXISTS idx_oas_action ON object_action_slots(action, object_id, slot);
+        COMMIT;
+        """
+    )
+
+    # R-tree over (x, y, plane) so get_nearby resolves a bounding box in one descent
+    try:
+        db_conn.executescript(
+            """
+            BEGIN;
+            DROP TABLE IF EXISTS objects_rtree;
+            CREATE VIRTUAL TABLE objects_rtree USING rtree_i32(
+                id, min_x, max_x, min_y, max_y, min_plane, max_plane
+            );
+            INSERT INTO objects_rtree
+                SELECT rowid,
+                       coord & 32767, coord & 32767,
+                       (coord >> 15) & 32767, (coord >> 15) & 32767,
+                       (coord >> 30) & 3, (coord >> 30) & 3
+                FROM objects_wide;
+            COMMIT;
+            """
+        )
+    except sqlite3.OperationalError as e:
+        # SQLite built without the rtree module - get_nearby falls back to a range scan
+        db_conn.rollback()
+        logger.warning(f"Objects spatial index unavailable: {e}")
+
+    # Trigram index over names so substring LIKE searches skip the full table scan
+    try:
+        db_conn.executescript(
+            """
+            BEGIN;
+            DROP TABLE IF EXISTS names_fts;
+            CREATE VIRTUAL TABLE names_fts USING fts5(
+                name, content='names', content_rowid='id', tokenize='trigram'
+            );
+            INSERT INTO names_fts(names_fts) VALUES ('rebuild');
+            COMMIT;
+            """
+        )
+    except sqlite3.OperationalError as e:
+        # SQLite built without fts5 - get_by_name falls back to LIKE over objects_wide
+        db_conn.rollback()
+        logger.warning(f"Objects name index unavailable: {e}")
+
+    db_conn.execute(f"PRAGMA user_version = {_OBJECTS_DB_SCHEMA}")
+    logger.success("Built objects database indexes")
+
+
+def _open_objects_db(db_file: Path) -> sqlite3.Connection:
+    """Open the objects database as a shared, read-only autocommit connection."""
+    # Derived tables are built through a short-lived writable connection
+    with contextlib.closing(sqlite3.connect(str(db_file), isolation_level=None)) as prep_conn:
+        _prepare_objects_db(prep_conn)
+
+    # The file only changes when a new revision is downloaded (before this runs), so it can be
+    # opened immutable: no locking or journal checks on any read
+    db_conn = sqlite3.connect(
+        f"{db_file.resolve().as_uri()}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=False,
+        isolation_level=None,
+    )
+    db_conn.execute("PRAGMA cache_size = -131072")  # 128 MiB page cache
+    db_conn.execute("PRAGMA mmap_size = 1073741824")
+    db_conn.execute("PRAGMA temp_store = MEMORY")
+    db_conn.execute("PRAGMA query_only = 1")
+    return db_conn
+
+
 def ensure_resources_loaded() -> bool:
     """Ensure game resources are downloaded and loaded."""
     global _resources_loaded
@@ -303,11 +418,8 @@ def ensure_resources_loaded() -> bool:
             logger.success(f"Loaded {varps.get_varbits_data_count()} varbits")
 
         # Load objects database
-        import sqlite3
-
         db_file = cache_dir / "objects.db"
-        db_conn = sqlite3.connect(str(db_file))
-        objects.set_db_connection(db_conn)
+        objects.set_db_connection(_open_objects_db(db_file))
         logger.success("Loaded objects database")
 
         _resources_loaded = True
@@ -321,8 +433,17 @@ def ensure_resources_loaded() -> bool:
         return False
 
 
+# Generated directory once it has been added to sys.path
+_generated_dir: Path | None = None
+
+
 def ensure_generated_in_path() -> Path:
     """Ensure the generated cache directory is in sys.path for imports."""
+    global _generated_dir
+
+    if _generated_dir is not None:
+        return _generated_dir
+
     cache_manager = get_cache_manager()
     generated_dir = cache_manager.generated_dir
 
@@ -331,6 +452,7 @@ def ensure_generated_in_path() -> Path:
     if generated_str not in sys.path:
         sys.path.insert(0, generated_str)
 
+    _generated_dir = generated_dir
     return generated_dir
 
 
@@ -3,12 +3,13 @@
 import atexit
 import functools
 import sys
+import weakref
 from collections.abc import Callable
 
 from escape._internal.logger import logger
 
-# Global tracking of resources that need cleanup
-_registered_apis = []
+# Global tracking of resources that need cleanup (weak, so dropped APIs can be collected)
+_registered_apis: weakref.WeakSet = weakref.WeakSet()
 _cleanup_registered = False
 
 
@@ -16,8 +17,7 @@ def register_api_for_cleanup(api) -> None:
     """Register a RuneLiteAPI instance for automatic cleanup on exit."""
     global _cleanup_registered
 
-    if api not in _registered_apis:
-        _registered_apis.append(api)
+    _registered_apis.add(api)
 
     # Register atexit handler on first registration
     if not _cleanup_registered:
@@ -0,0 +1,15 @@
+"""Counter of OS input events, for caches of client state that input can change."""
+
+# Bumped after every mouse/keyboard primitive; readers compare it to the value they cached at
+_generation: int = 0
+
+
+def bump() -> None:
+    """Record that an input event was sent."""
+    global _generation
+    _generation += 1
+
+
+def get() -> int:
+    """Get the current input generation."""
+    return _generation
@@ -0,0 +1,22 @@
+"""Direct X11 pointer control through the XTest extension."""
+
+from Xlib import X, display
+from Xlib.ext import xtest
+
+# Lazily opened connection reused for every pointer event
+_display: display.Display | None = None
+
+
+def _get_display() -> display.Display:
+    """Get the shared X11 display connection."""
+    global _display
+    if _display is None:
+        _display = display.Display()
+    return _display
+
+
+def move_abs(x: int, y: int) -> None:
+    """Move the pointer to absolute screen coordinates."""
+    conn = _get_display()
+    xtest.fake_input(conn, X.MotionNotify, x=x, y=y)
+    conn.sync()
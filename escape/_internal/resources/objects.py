@@ -1,10 +1,13 @@
 """Game Objects accessor functions for OSRS object definitions and locations."""
 
+import functools
 import sqlite3
 from typing import Any
 
+import numpy as np
+
 from escape._internal.logger import logger
-from escape.types.packed_position import pack_position_signed, unpack_position
+from escape.types.packed_position import pack_position_signed, unpack_positions
 
 __all__ = [
     "close",
@@ -22,6 +25,70 @@ __all__ = [
 
 # Module-level database connection (loaded by cache_manager at init)
 _db_connection: sqlite3.Connection | None = None
+# Whether the objects_rtree spatial index was built (see cache_manager._prepare_objects_db)
+_has_rtree: bool = False
+# Whether the names_fts trigram index was built (see cache_manager._prepare_objects_db)
+_has_names_fts: bool = False
+
+# SQL is kept as module constants so every call hits the connection's statement cache
+_SQL_GET_BY_ID = """
+    SELECT object_id, name
+    FROM objects_wide
+    WHERE object_id = ? AND name IS NOT NULL
+    LIMIT 1
+"""
+
+_SQL_GET_BY_NAME_EXACT = """
+    SELECT DISTINCT object_id, name
+    FROM objects_wide
+    WHERE name = ?
+"""
+
+_SQL_GET_BY_NAME_LIKE = """
+    SELECT DISTINCT object_id, name
+    FROM objects_wide
+    WHERE name LIKE ?
+"""
+
+# Trigram index resolves the LIKE pattern; the name index then finds the objects
+_SQL_GET_BY_NAME_FTS = """
+    SELECT DISTINCT object_id, name
+    FROM objects_wide
+    WHERE name IN (SELECT name FROM names_fts WHERE name LIKE ?)
+"""
+
+_SQL_GET_LOCATIONS = "SELECT coord FROM objects_wide WHERE object_id = ?"
+
+# Single R-tree descent over the (x, y, plane) box
+_SQL_NEARBY_RTREE = """
+    SELECT o.coord, o.object_id, o.name
+    FROM objects_rtree r
+    JOIN objects_wide o ON o.rowid = r.id
+    WHERE r.min_x >= ? AND r.max_x <= ?
+      AND r.min_y >= ? AND r.max_y <= ?
+      AND r.min_plane >= ? AND r.max_plane <= ?
+"""
+
+# Packed format is [plane(2)][y(15)][x(15)], so within one plane the bounding box
+# lies inside a single contiguous coord range ordered by (y, x). One BETWEEN walks
+# the coord index once; the residual mask drops rows outside the X bounds.
+_SQL_NEARBY_RANGE = """
+    SELECT coord, object_id, name
+    FROM objects_wide
+    WHERE coord BETWEEN ? AND ?
+      AND (coord & 32767) BETWEEN ? AND ?
+"""
+
+# Seek matching objects via the action index, then read their pre-pivoted slot row
+_SQL_SEARCH_BY_ACTION = """
+    SELECT object_id, name, slot0, slot1, slot2, slot3, slot4
+    FROM object_action_slots_wide
+    WHERE object_id IN (SELECT object_id FROM object_action_slots WHERE action = ?)
+"""
+
+_SQL_COUNT_OBJECTS = "SELECT COUNT(DISTINCT object_id) FROM objects_wide"
+
+_SQL_COUNT_LOCATIONS = "SELECT COUNT(*) FROM objects_wide"
 
 
 def get_by_id(object_id: int) -> dict[str, Any] | None:
@@ -30,53 +97,34 @@ def get_by_id(object_id: int) -> dict[str, Any] | None:
         logger.error("Objects database not loaded")
         return None
 
-    cursor = _db_connection.cursor()
-    cursor.execute(
-        """
-        SELECT DISTINCT o.object_id, n.name
-        FROM objects o
-        JOIN names n ON o.name_id = n.id
-        WHERE o.object_id = ?
-        LIMIT 1
-    """,
-        (object_id,),
-    )
-
-    row = cursor.fetchone()
+    row = _get_by_id_cached(_db_connection, object_id)
     if row:
         return {"id": row[0], "name": row[1]}
     return None
 
 
+# Definitions never change while a connection is open, so lookups are memoized until
+# close()/set_db_connection(); the accessors hand out fresh dicts from the cached tuples
+@functools.lru_cache(maxsize=8192)
+def _get_by_id_cached(conn: sqlite3.Connection, object_id: int) -> tuple[int, str] | None:
+    row = conn.execute(_SQL_GET_BY_ID, (object_id,)).fetchone()
+    return (row[0], row[1]) if row else None
+
+
 def get_by_name(name: str, exact: bool = False) -> list[dict[str, Any]]:
     """Search for objects by name."""
     if _db_connection is None:
         logger.error("Objects database not loaded")
         return []
 
-    cursor = _db_connection.cursor()
     if exact:
-        cursor.execute(
-            """
-            SELECT DISTINCT o.object_id, n.name
-            FROM objects o
-            JOIN names n ON o.name_id = n.id
-            WHERE n.name = ?
-        """,
-            (name,),
-        )
+        rows = _db_connection.execute(_SQL_GET_BY_NAME_EXACT, (name,))
+    elif _has_names_fts:
+        rows = _db_connection.execute(_SQL_GET_BY_NAME_FTS, (f"%{name}%",))
     else:
-        cursor.execute(
-            """
-            SELECT DISTINCT o.object_id, n.name
-            FROM objects o
-            JOIN names n ON o.name_id = n.id
-            WHERE n.name LIKE ?
-        """,
-            (f"%{name}%",),
-        )
+        rows = _db_connection.execute(_SQL_GET_BY_NAME_LIKE, (f"%{name}%",))
 
-    return [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+    return [{"id": row[0], "name": row[1]} for row in rows]
 
 
 def get_locations(object_id: int) -> list[tuple[int, int, int]]:
@@ -85,20 +133,15 @@ def get_locations(object_id: int) -> list[tuple[int, int, int]]:
         logger.error("Objects database not loaded")
         return []
 
-    cursor = _db_connection.cursor()
-    cursor.execute("SELECT coord FROM objects WHERE object_id = ?", (object_id,))
-
-    locations = []
-    for row in cursor.fetchall():
-        packed_pos = row[0]
-        x, y, plane = unpack_position(packed_pos)
-        locations.append((x, y, plane))
-
-    return locations
+    rows = _db_connection.execute(_SQL_GET_LOCATIONS, (object_id,))
+    xs, ys, planes = unpack_positions(np.fromiter((row[0] for row in rows), dtype=np.int64))
+    return list(zip(xs.tolist(), ys.tolist(), planes.tolist(), strict=True))
 
 
-def get_nearby(x: int, y: int, plane: int = 0, radius: int = 10) -> list[dict[str, Any]]:
-    """Get all objects near a coordinate."""
+def get_nearby(
+    x: int, y: int, plane: int = 0, radius: int = 10, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Get objects near a coordinate, nearest first (optionally only the nearest `limit`)."""
     if _db_connection is None:
         logger.error("Objects database not loaded")
         return []
@@ -109,58 +152,38 @@ def get_nearby(x: int, y: int, plane: int = 0, radius: int = 10) -> list[dict[st
     min_y = max(0, y - radius)
     max_y = min(32767, y + radius)
 
-    # Build precise packed position ranges for each X coordinate
-    # Since packed format is [plane(2)][x(15)][y(15)], for each X value
-    # we can create exact BETWEEN ranges for all Y values in range
-    # IMPORTANT: Use signed packing for SQLite compatibility (planes 2-3 become negative)
-    ranges = []
-    for curr_x in range(min_x, max_x + 1):
-        min_packed = pack_position_signed(curr_x, min_y, plane)
-        max_packed = pack_position_signed(curr_x, max_y, plane)
-        ranges.append((min_packed, max_packed))
-
-    # Build SQL query with OR'd BETWEEN clauses for precise filtering
-    or_clauses = " OR ".join(["(o.coord BETWEEN ? AND ?)"] * len(ranges))
-
-    query = f"""
-        SELECT o.coord, o.object_id, n.name
-        FROM objects o
-        LEFT JOIN names n ON o.name_id = n.id
-        WHERE {or_clauses}
-    """
-
-    # Flatten ranges for query parameters
-    params = []
-    for min_p, max_p in ranges:
-        params.extend([min_p, max_p])
-
-    cursor = _db_connection.cursor()
-    cursor.execute(query, params)
-
-    results = []
-    for row in cursor.fetchall():
-        packed_pos = row[0]
-        obj_x, obj_y, obj_plane = unpack_position(packed_pos)
-
-        # Calculate distance (all results should be within radius)
-        dx = abs(obj_x - x)
-        dy = abs(obj_y - y)
-
-        results.append(
-            {
-                "object_id": row[1],
-                "name": row[2],
-                "x": obj_x,
-                "y": obj_y,
-                "plane": obj_plane,
-                "distance": max(dx, dy),  # Chebyshev distance
-            }
-        )
-
-    # Sort by distance
-    results.sort(key=lambda obj: obj["distance"])
-
-    return results
+    if _has_rtree:
+        rows = _db_connection.execute(_SQL_NEARBY_RTREE, (min_x, max_x, min_y, max_y, plane, plane))
+    else:
+        # IMPORTANT: Use signed packing for SQLite compatibility (planes 2-3 become negative)
+        min_packed = pack_position_signed(min_x, min_y, plane)
+        max_packed = pack_position_signed(max_x, max_y, plane)
+        rows = _db_connection.execute(_SQL_NEARBY_RANGE, (min_packed, max_packed, min_x, max_x))
+
+    rows = rows.fetchall()
+    if not rows:
+        return []
+
+    # Unpack and measure every row at once instead of per-row Python arithmetic
+    coords = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    xs, ys, planes = unpack_positions(coords)
+    distances = np.maximum(np.abs(xs - x), np.abs(ys - y))  # Chebyshev distance
+
+    # Sort by distance (stable, so ties keep index order); dicts are only built for kept rows
+    order = np.argsort(distances, kind="stable")[:limit].tolist()
+    xs, ys, planes, distances = xs.tolist(), ys.tolist(), planes.tolist(), distances.tolist()
+
+    return [
+        {
+            "object_id": rows[i][1],
+            "name": rows[i][2],
+            "x": xs[i],
+            "y": ys[i],
+            "plane": planes[i],
+            "distance": distances[i],
+        }
+        for i in order
+    ]
 
 
 def search_by_action(action: str) -> list[dict[str, Any]]:
@@ -169,47 +192,15 @@ def search_by_action(action: str) -> list[dict[str, Any]]:
         logger.error("Objects database not loaded")
         return []
 
-    cursor = _db_connection.cursor()
-
-    # Get all unique objects with this action
-    cursor.execute(
-        """
-        SELECT DISTINCT o.object_id, n.name
-        FROM object_action_slots oas
-        JOIN objects o ON oas.object_id = o.object_id
-        LEFT JOIN names n ON o.name_id = n.id
-        WHERE oas.action = ?
-    """,
-        (action,),
-    )
-
-    results = []
-    for row in cursor.fetchall():
-        object_id = row[0]
-        name = row[1]
-
-        # Get all actions for this object
-        cursor.execute(
-            """
-            SELECT slot, action
-            FROM object_action_slots
-            WHERE object_id = ?
-            ORDER BY slot
-        """,
-            (object_id,),
-        )
-
-        # Build actions array [slot0, slot1, slot2, slot3, slot4]
-        actions = [None] * 5
-        for action_row in cursor.fetchall():
-            slot = action_row[0]
-            action_text = action_row[1]
-            if 0 <= slot <= 4:
-                actions[slot] = action_text
-
-        results.append({"id": object_id, "name": name, "actions": actions})
-
-    return results
+    return [
+        {"id": row[0], "name": row[1], "actions": list(row[2:7])}
+        for row in _search_by_action_cached(_db_connection, action)
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _search_by_action_cached(conn: sqlite3.Connection, action: str) -> tuple[tuple, ...]:
+    return tuple(tuple(row) for row in conn.execute(_SQL_SEARCH_BY_ACTION, (action,)))
 
 
 def count_objects() -> int:
@@ -218,9 +209,7 @@ def count_objects() -> int:
         logger.error("Objects database not loaded")
         return 0
 
-    cursor = _db_connection.cursor()
-    cursor.execute("SELECT COUNT(DISTINCT object_id) FROM objects")
-    return cursor.fetchone()[0]
+    return _count_cached(_db_connection, _SQL_COUNT_OBJECTS)
 
 
 def count_locations() -> int:
@@ -229,9 +218,12 @@ def count_locations() -> int:
         logger.error("Objects database not loaded")
         return 0
 
-    cursor = _db_connection.cursor()
-    cursor.execute("SELECT COUNT(*) FROM objects")
-    return cursor.fetchone()[0]
+    return _count_cached(_db_connection, _SQL_COUNT_LOCATIONS)
+
+
+@functools.cache
+def _count_cached(conn: sqlite3.Connection, sql: str) -> int:
+    return conn.execute(sql).fetchone()[0]
 
 
 def execute_query(query: str, params: tuple = ()) -> list[dict[str, Any]]:
@@ -240,21 +232,38 @@ def execute_query(query: str, params: tuple = ()) -> list[dict[str, Any]]:
         logger.error("Objects database not loaded")
         return []
 
-    cursor = _db_connection.cursor()
-    cursor.execute(query, params)
-    return [dict(row) for row in cursor.fetchall()]
+    cursor = _db_connection.execute(query, params)
+    if cursor.description is None:
+        return []
+
+    # Column names are resolved once per query rather than per row
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in cursor]
+
+
+def _clear_caches() -> None:
+    """Drop memoized lookups tied to the current connection."""
+    _get_by_id_cached.cache_clear()
+    _search_by_action_cached.cache_clear()
+    _count_cached.cache_clear()
 
 
 def close():
     """Close database connection (called at shutdown)."""
-    global _db_connection
+    global _db_connection, _has_rtree, _has_names_fts
+    _clear_caches()
     if _db_connection:
         _db_connection.close()
         _db_connection = None
+    _has_rtree = False
+    _has_names_fts = False
 
 
 def set_db_connection(conn: sqlite3.Connection) -> None:
     """Set the database connection (called by cache_manager during initialization)."""
-    global _db_connection
+    global _db_connection, _has_rtree, _has_names_fts
+    _clear_caches()
     _db_connection = conn
-    _db_connection.row_factory = sqlite3.Row
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    _has_rtree = "objects_rtree" in tables
+    _has_names_fts = "names_fts" in tables
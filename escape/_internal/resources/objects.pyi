@@ -3,10 +3,16 @@
 import sqlite3
 from typing import Any
 
+# Optional indexes built by cache_manager._prepare_objects_db
+_has_rtree: bool
+_has_names_fts: bool
+
 def get_by_id(object_id: int) -> dict[str, Any] | None: ...
 def get_by_name(name: str, exact: bool = False) -> list[dict[str, Any]]: ...
 def get_locations(object_id: int) -> list[tuple[int, int, int]]: ...
-def get_nearby(x: int, y: int, plane: int = 0, radius: int = 10) -> list[dict[str, Any]]: ...
+def get_nearby(
+    x: int, y: int, plane: int = 0, radius: int = 10, limit: int | None = None
+) -> list[dict[str, Any]]: ...
 def search_by_action(action: str) -> list[dict[str, Any]]: ...
 def count_objects() -> int: ...
 def count_locations() -> int: ...
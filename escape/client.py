@@ -6,7 +6,7 @@ from types import ModuleType
 from typing import TYPE_CHECKING
 
 from escape._internal.api import RuneLiteAPI
-from escape._internal.cache_manager import ensure_generated_in_path, ensure_resources_loaded
+from escape._internal.cache_manager import ensure_resources_loaded
 from escape._internal.logger import logger
 from escape._internal.resources import objects as objects_module
 from escape._internal.resources import varps as varps_module
@@ -56,7 +56,7 @@ def _ensure_generated_symlink() -> None:
 
 
 # Ensure symlink is active before importing generated modules
-ensure_generated_in_path()
+# (cache_manager already put the generated directory on sys.path when it was imported)
 _ensure_generated_symlink()
 
 # Check for game resource updates
@@ -1,9 +1,35 @@
 """OS-level input handling - mouse, keyboard, and drawing."""
 
-from escape.input.drawing import Drawing, drawing
-from escape.input.keyboard import Keyboard, keyboard
-from escape.input.mouse import Mouse, mouse
-from escape.input.runelite import RuneLite, runelite
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from escape.input.drawing import Drawing, drawing
+    from escape.input.keyboard import Keyboard, keyboard
+    from escape.input.mouse import Mouse, mouse
+    from escape.input.runelite import RuneLite, runelite
+
+# Submodules are imported on first access (PEP 562) so importing one controller does not
+# construct the others (X11 window probing, pyautogui setup)
+_LAZY_ATTRS = {
+    "Drawing": "escape.input.drawing",
+    "drawing": "escape.input.drawing",
+    "Keyboard": "escape.input.keyboard",
+    "keyboard": "escape.input.keyboard",
+    "Mouse": "escape.input.mouse",
+    "mouse": "escape.input.mouse",
+    "RuneLite": "escape.input.runelite",
+    "runelite": "escape.input.runelite",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 class Input:
@@ -17,23 +43,31 @@ class Input:
         return cls._instance
 
     @property
-    def runelite(self) -> RuneLite:
+    def runelite(self) -> "RuneLite":
         """RuneLite window manager."""
+        from escape.input.runelite import runelite
+
         return runelite
 
     @property
-    def mouse(self) -> Mouse:
+    def mouse(self) -> "Mouse":
         """Mouse controller."""
+        from escape.input.mouse import mouse
+
         return mouse
 
     @property
-    def keyboard(self) -> Keyboard:
+    def keyboard(self) -> "Keyboard":
         """Keyboard controller."""
+        from escape.input.keyboard import keyboard
+
         return keyboard
 
     @property
-    def drawing(self) -> Drawing:
+    def drawing(self) -> "Drawing":
         """Drawing overlay for debugging."""
+        from escape.input.drawing import drawing
+
         return drawing
 
 
@@ -1,7 +1,41 @@
 """Drawing module - renders shapes directly on RuneLite via Java bridge."""
 
-import numpy as np
-from PIL import Image
+import functools
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Keeps the packed int32 pixels rather than the boxed list (~9x smaller); a couple of
+# entries cover an overlay redrawn every frame without pinning many large images
+@functools.lru_cache(maxsize=2)
+def _load_argb_pixels(path: str, mtime_ns: int) -> tuple["np.ndarray", int, int]:
+    """Decode an image file into a signed ARGB pixel array (cached per file version)."""
+    import numpy as np
+    from PIL import Image
+
+    img = Image.open(path).convert("RGBA")
+    pixels = np.asarray(img, dtype=np.uint8)
+
+    # Reorder RGBA -> BGRA in one copy; read as little-endian int32 that is 0xAARRGGBB
+    # (signed, as Java expects)
+    argb = np.ascontiguousarray(pixels[:, :, [2, 1, 0, 3]]).view("<i4").ravel()
+    argb.flags.writeable = False
+
+    width, height = img.size
+    return argb, width, height
+
+
+# JNI signatures of the Java Drawing add* overloads: (untagged, tagged)
+_ADD_SIGNATURES: dict[str, tuple[str, str]] = {
+    "addBox": ("(IIIIIZ)V", "(IIIIIZLjava/lang/String;)V"),
+    "addCircle": ("(IIIIZ)V", "(IIIIZLjava/lang/String;)V"),
+    "addLine": ("(IIIIII)V", "(IIIIIILjava/lang/String;)V"),
+    "addPolygon": ("([I[IIZ)V", "([I[IIZLjava/lang/String;)V"),
+    "addImage": ("([IIIII)V", "([IIIIILjava/lang/String;)V"),
+}
 
 
 class Drawing:
@@ -32,6 +66,14 @@ class Drawing:
             declaring_class="Drawing",
         )
 
+    def _add(self, method: str, args: list, tag: str | None) -> None:
+        """Invoke an add* method, choosing the tagged overload when a tag is given."""
+        untagged, tagged = _ADD_SIGNATURES[method]
+        if tag is None:
+            self._invoke(method, untagged, args)
+        else:
+            self._invoke(method, tagged, [*args, tag])
+
     def add_box(
         self,
         x: int,
@@ -43,18 +85,7 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw a rectangle at screen coordinates."""
-        if tag is None:
-            self._invoke(
-                "addBox",
-                "(IIIIIZ)V",
-                [x, y, width, height, argb_color, filled],
-            )
-        else:
-            self._invoke(
-                "addBox",
-                "(IIIIIZLjava/lang/String;)V",
-                [x, y, width, height, argb_color, filled, tag],
-            )
+        self._add("addBox", [x, y, width, height, argb_color, filled], tag)
 
     def add_circle(
         self,
@@ -66,18 +97,7 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw a circle at screen coordinates."""
-        if tag is None:
-            self._invoke(
-                "addCircle",
-                "(IIIIZ)V",
-                [x, y, radius, argb_color, filled],
-            )
-        else:
-            self._invoke(
-                "addCircle",
-                "(IIIIZLjava/lang/String;)V",
-                [x, y, radius, argb_color, filled, tag],
-            )
+        self._add("addCircle", [x, y, radius, argb_color, filled], tag)
 
     def add_line(
         self,
@@ -90,18 +110,7 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw a line between two points."""
-        if tag is None:
-            self._invoke(
-                "addLine",
-                "(IIIIII)V",
-                [x1, y1, x2, y2, argb_color, thickness],
-            )
-        else:
-            self._invoke(
-                "addLine",
-                "(IIIIIILjava/lang/String;)V",
-                [x1, y1, x2, y2, argb_color, thickness, tag],
-            )
+        self._add("addLine", [x1, y1, x2, y2, argb_color, thickness], tag)
 
     def add_polygon(
         self,
@@ -112,18 +121,7 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw a polygon from vertex arrays."""
-        if tag is None:
-            self._invoke(
-                "addPolygon",
-                "([I[IIZ)V",
-                [x_points, y_points, argb_color, filled],
-            )
-        else:
-            self._invoke(
-                "addPolygon",
-                "([I[IIZLjava/lang/String;)V",
-                [x_points, y_points, argb_color, filled, tag],
-            )
+        self._add("addPolygon", [x_points, y_points, argb_color, filled], tag)
 
     def add_text(
         self,
@@ -158,18 +156,7 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw an image from ARGB pixel array."""
-        if tag is None:
-            self._invoke(
-                "addImage",
-                "([IIIII)V",
-                [argb_pixels, img_width, img_height, x, y],
-            )
-        else:
-            self._invoke(
-                "addImage",
-                "([IIIIILjava/lang/String;)V",
-                [argb_pixels, img_width, img_height, x, y, tag],
-            )
+        self._add("addImage", [argb_pixels, img_width, img_height, x, y], tag)
 
     def add_image_from_path(
         self,
@@ -179,24 +166,10 @@ class Drawing:
         tag: str | None = None,
     ) -> None:
         """Draw an image from a file path."""
-        img = Image.open(path).convert("RGBA")
-        pixels = np.array(img)
-
-        # Convert RGBA to ARGB int array (0xAARRGGBB)
-        argb = (
-            (pixels[:, :, 3].astype(np.uint32) << 24)
-            | (pixels[:, :, 0].astype(np.uint32) << 16)
-            | (pixels[:, :, 1].astype(np.uint32) << 8)
-            | pixels[:, :, 2].astype(np.uint32)
-        )
-
-        # Convert to signed 32-bit integers (Java expects signed ints)
-        argb_signed = argb.astype(np.int32)
-
-        width, height = img.size
-        pixel_list = argb_signed.flatten().tolist()
-
-        self.add_image(pixel_list, width, height, x, y, tag)
+        # Decoding is reused across redraws; the bridge only accepts int lists, so the
+        # compact cached array is expanded per call
+        argb, width, height = _load_argb_pixels(path, os.stat(path).st_mtime_ns)
+        self.add_image(argb.tolist(), width, height, x, y, tag)
 
     def clear(self) -> None:
         """Clear all drawings."""
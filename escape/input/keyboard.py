@@ -4,10 +4,7 @@ import random
 import time
 from typing import Any
 
-try:
-    import pyautogui as pag
-except ImportError:
-    pag = None
+from escape._internal import input_generation
 
 
 class Keyboard:
@@ -25,17 +22,28 @@ class Keyboard:
         """Actual initialization, runs once."""
         from escape.input.runelite import runelite
 
-        if pag is None:
-            raise ImportError("pyautogui is required. Install with: pip install pyautogui")
-
-        # Configure pyautogui
-        pag.PAUSE = 0
-        pag.FAILSAFE = False
-        self._pag: Any = pag
+        self._pag_module: Any = None
 
         self.runelite = runelite
         self.speed = speed
 
+    @property
+    def _pag(self) -> Any:
+        """Pyautogui module, imported and configured on first use."""
+        if self._pag_module is None:
+            try:
+                import pyautogui as pag
+            except ImportError as e:
+                raise ImportError(
+                    "pyautogui is required. Install with: pip install pyautogui"
+                ) from e
+
+            # Configure pyautogui
+            pag.PAUSE = 0
+            pag.FAILSAFE = False
+            self._pag_module = pag
+        return self._pag_module
+
     def _ensure_focus(self) -> None:
         """Ensure RuneLite window is ready for input."""
         self.runelite.refresh_window_position()
@@ -44,21 +52,25 @@ class Keyboard:
         """Core press function - ONLY access point to pyautogui.press()."""
         self._ensure_focus()
         self._pag.press(key, _pause=False)
+        input_generation.bump()
 
     def _key_down(self, key: str) -> None:
         """Core key down function - ONLY access point to pyautogui.keyDown()."""
         self._ensure_focus()
         self._pag.keyDown(key, _pause=False)
+        input_generation.bump()
 
     def _key_up(self, key: str) -> None:
         """Core key up function - ONLY access point to pyautogui.keyUp()."""
         self._ensure_focus()
         self._pag.keyUp(key, _pause=False)
+        input_generation.bump()
 
     def _type_char(self, char: str) -> None:
         """Core type function - ONLY access point to pyautogui.write() for single char."""
         self._ensure_focus()
         self._pag.write(char, interval=0, _pause=False)
+        input_generation.bump()
 
     def type(self, text: str, humanize: bool = True) -> None:
         """Type text with optional human-like delays."""
@@ -4,10 +4,7 @@ import random
 import time
 from typing import Any
 
-try:
-    import pyautogui as pag
-except ImportError:
-    pag = None
+from escape._internal import input_generation, native_mouse
 
 
 class Mouse:
@@ -25,19 +22,30 @@ class Mouse:
         """Actual initialization, runs once."""
         from escape.input.runelite import runelite
 
-        if pag is None:
-            raise ImportError("pyautogui is required. Install with: pip install pyautogui")
-
-        # Configure pyautogui for instant movement
-        pag.PAUSE = 0
-        pag.FAILSAFE = False
-        pag.MINIMUM_SLEEP = 0
-        pag.MINIMUM_DURATION = 0
-        self._pag: Any = pag
+        self._pag_module: Any = None
 
         self.runelite = runelite
         self.speed = speed
 
+    @property
+    def _pag(self) -> Any:
+        """Pyautogui module, imported and configured on first use."""
+        if self._pag_module is None:
+            try:
+                import pyautogui as pag
+            except ImportError as e:
+                raise ImportError(
+                    "pyautogui is required. Install with: pip install pyautogui"
+                ) from e
+
+            # Configure pyautogui for instant movement
+            pag.PAUSE = 0
+            pag.FAILSAFE = False
+            pag.MINIMUM_SLEEP = 0
+            pag.MINIMUM_DURATION = 0
+            self._pag_module = pag
+        return self._pag_module
+
     @property
     def position(self) -> tuple[int, int]:
         """Get current mouse position relative to game window."""
@@ -67,72 +75,17 @@ class Mouse:
             )
 
     def _move_to(self, x: int, y: int, safe: bool = True) -> None:
-        """Core movement function - ONLY access point to pyautogui.moveTo()."""
+        """Core movement function - ONLY access point to pointer motion."""
         # Ensure window is ready
         self.runelite.refresh_window_position()
-        # temp override for performance testing
 
-        time.perf_counter()
         offset = self.runelite.get_window_offset()
         if offset is None:
             raise RuntimeError("Could not get window offset")
-        self._pag.moveTo(x + offset[0], y + offset[1], _pause=False)
-        time.sleep(0.001)  # slight delay to ensure move completes
-        return
-        # Validate coordinates
-        self._validate_coordinates(x, y, safe)
-
-        # Convert to absolute screen coordinates
-        offset = self.runelite.get_window_offset()
-        if not offset:
-            raise RuntimeError("Could not get window offset")
-
-        abs_x = x + offset[0]
-        abs_y = y + offset[1]
-
-        # Get current position
-        current_x, current_y = self._pag.position()
-
-        # Calculate distance
-        dx = abs_x - current_x
-        dy = abs_y - current_y
-        distance = (dx**2 + dy**2) ** 0.5
-
-        if distance == 0:
-            return  # Already at target
-
-        # Base step size: ~20 pixels per step at speed=1.0
-        base_step_size = 20.0 * self.speed
 
-        # Calculate number of steps (20ms per step)
-        num_steps = max(1, int(distance / base_step_size))
-
-        # Move in steps
-        for step in range(num_steps):
-            # Calculate progress (0.0 to 1.0)
-            progress = (step + 1) / num_steps
-
-            # Add randomness to step size (±20% variation)
-            step_randomness = random.uniform(0.8, 1.2)
-
-            # Calculate intermediate position
-            intermediate_x = current_x + int(dx * progress)
-            intermediate_y = current_y + int(dy * progress)
-
-            # Add slight random offset for human-like movement (±2 pixels)
-            jitter_x = random.randint(-2, 2) if step < num_steps - 1 else 0
-            jitter_y = random.randint(-2, 2) if step < num_steps - 1 else 0
-
-            # Move to intermediate position
-            self._pag.moveTo(
-                intermediate_x + jitter_x, intermediate_y + jitter_y, duration=0, _pause=False
-            )
-
-            # Wait 20ms (with slight randomness)
-            time.sleep(0.020 * step_randomness)
-
-        # Final move to exact target (no jitter)
-        self._pag.moveTo(abs_x, abs_y, duration=0, _pause=False)
+        # XTest requests are synced, so the move has landed before any follow-up click
+        native_mouse.move_abs(x + offset[0], y + offset[1])
+        input_generation.bump()
 
     def _click_button(self, button: str) -> None:
         """Core click function - ONLY access point to pyautogui.click()."""
@@ -141,6 +94,7 @@ class Mouse:
 
         # Perform click
         self._pag.click(button=button, _pause=False)
+        input_generation.bump()
 
     def _hold(self, button: str) -> None:
         """Core hold function - ONLY access point to pyautogui.mouseDown()."""
@@ -149,6 +103,7 @@ class Mouse:
 
         # Hold button down
         self._pag.mouseDown(button=button, _pause=False)
+        input_generation.bump()
 
     def _release(self, button: str) -> None:
         """Core release function - ONLY access point to pyautogui.mouseUp()."""
@@ -157,6 +112,7 @@ class Mouse:
 
         # Release button
         self._pag.mouseUp(button=button, _pause=False)
+        input_generation.bump()
 
     def _scroll(self, clicks: int) -> None:
         """Core scroll function - ONLY access point to pyautogui.scroll()."""
@@ -165,6 +121,7 @@ class Mouse:
 
         # Perform scroll
         self._pag.scroll(clicks, _pause=False)
+        input_generation.bump()
 
     def click(self, button: str = "left") -> None:
         self._click_button(button)
@@ -175,13 +132,10 @@ class Mouse:
 
     def left_click(self, x: int | None = None, y: int | None = None, safe: bool = True) -> None:
         """Perform left click at current position or move to position and click."""
-        import time
-
-        time.perf_counter()
         if x is not None and y is not None:
             self._move_to(x, y, safe=safe)
+
         self._click_button("left")
-        time.perf_counter()
 
     def right_click(self, x: int | None = None, y: int | None = None, safe: bool = True) -> None:
         """Perform right click at current position or move to position and click."""
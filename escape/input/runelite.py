@@ -10,6 +10,9 @@ from Xlib import X, display
 
 from escape.types.box import Box
 
+# Seconds a successful refresh_window_position() is trusted before checking again
+REFRESH_INTERVAL = 0.05
+
 
 class RuneLite:
     """RuneLite window position tracker using X11 events."""
@@ -35,6 +38,8 @@ class RuneLite:
         self._is_active: bool = False
         self._state_valid: bool = False
         self._window_box: Box = Box(4, 4, 765, 503)
+        # perf_counter() of the last refresh that found the window ready
+        self._last_refresh: float = 0.0
 
         # Thread synchronization
         self._lock = threading.Lock()
@@ -137,6 +142,7 @@ class RuneLite:
                     window_id = evt.window.id if hasattr(evt.window, "id") else evt.window
                     if window_id == self._window_id:
                         self._is_minimized = True
+                        self._last_refresh = 0.0
 
             # MapNotify: window restored/shown
             elif evt.type == X.MapNotify:
@@ -158,6 +164,7 @@ class RuneLite:
                     window_id = evt.window.id if hasattr(evt.window, "id") else evt.window
                     if window_id == self._window_id:
                         self._is_active = False
+                        self._last_refresh = 0.0
 
             # PropertyNotify on root: check for active window change
             elif evt.type == X.PropertyNotify and hasattr(evt, "atom"):
@@ -344,6 +351,10 @@ class RuneLite:
         if force:
             return self.detect_window()
 
+        # Input paths refresh several times per action; the window doesn't move that fast
+        if time.perf_counter() - self._last_refresh < REFRESH_INTERVAL:
+            return True
+
         with self._lock:
             if not self._state_valid:
                 # First time, need detection
@@ -353,10 +364,14 @@ class RuneLite:
                 pass
             else:
                 # State is valid and window is ready
+                self._last_refresh = time.perf_counter()
                 return True
 
         # Need to ensure window is ready
-        return self.ensure_window_ready()
+        if not self.ensure_window_ready():
+            return False
+        self._last_refresh = time.perf_counter()
+        return True
 
     def _auto_refresh(self) -> None:
         """Auto-refresh window position if enabled."""
@@ -1,7 +1,8 @@
 """Menu module - handles right-click context menu interactions."""
 
+import functools
+import random
 import time
-from copy import deepcopy
 
 from escape.client import client
 from escape.types import Box
@@ -22,34 +23,60 @@ class Menu:
 
     def _init(self):
         """Actual initialization, runs once."""
-        pass  # No initialization needed
+        # Last formatted snapshot, keyed by the menu event it was built from:
+        # (options, types, options_lower, types_lower)
+        self._cached_key: tuple | None = None
+        self._cached_result: tuple[tuple[str, ...], ...] = ((), (), (), ())
 
     def is_open(self) -> bool:
         """Check if the right-click context menu is currently open."""
         return client.cache.get_menu_open_state().get("menu_open", False)
 
     def _get_options(self, strip_colors: bool = True) -> tuple[list[str], list[str]]:
-        data = deepcopy(client.cache.get_menu_options())
+        formatted_options, types, _, _ = self._get_formatted(strip_colors)
+        return list(formatted_options), list(types)
+
+    def _get_formatted(self, strip_colors: bool = True) -> tuple[tuple[str, ...], ...]:
+        # Shallow read: the cache lists are never mutated here, only copied/rebuilt
+        data = client.cache.get_menu_options()
+        options = data.get("options", [])
+
+        # Each menu event is a new dict with its own timestamp, so polls within one
+        # menu frame reuse the already formatted result
+        key = (data.get("_timestamp"), id(options), strip_colors)
+        if key != self._cached_key:
+            self._cached_result = self._format_options(data, strip_colors)
+            self._cached_key = key
+
+        return self._cached_result
+
+    def _format_options(self, data: dict, strip_colors: bool) -> tuple[tuple[str, ...], ...]:
         types = data.get("types", [])
         options = data.get("options", [])
         targets = data.get("targets", [])
 
         if not types or not options or not targets:
-            return [], []
-
-        # Combine types, options, and targets into formatted strings
+            return (), (), (), ()
 
+        # Combine options and targets; most plain verbs have no target, so skip the join
         formatted_options = [
-            f"{option} {target}".strip() for option, target in zip(options, targets, strict=False)
+            option + " " + target if option and target else option or target
+            for option, target in zip(options, targets, strict=False)
         ]
         if strip_colors:
-            formatted_options = [strip_color_tags(opt) for opt in formatted_options]
+            formatted_options = map(strip_color_tags, formatted_options)
 
         # reverse because they're stored backwards (last item is first option)
-        formatted_options.reverse()
-        types.reverse()
-
-        return formatted_options, types
+        formatted_options = tuple(formatted_options)[::-1]
+        types = tuple(reversed(types))
+
+        # Lowercased once per snapshot for the case-insensitive substring scans
+        return (
+            formatted_options,
+            types,
+            tuple(opt.lower() for opt in formatted_options),
+            tuple(t.lower() for t in types),
+        )
 
     def _get_menu_info(self) -> dict:
         return client.cache.get_menu_open_state()
@@ -64,30 +91,30 @@ class Menu:
         ) < max_age and not client.cache.is_menu_option_clicked_consumed():
             return True
 
-        def check_event(ts) -> bool:
-            state = client.cache.get_menu_clicked_state()
-            event_time = state.get("_timestamp", 0)
-            return (event_time - ts) > 0
-
         return timing.wait_until(
-            lambda: check_event(timestamp), timeout=timeout, poll_interval=0.001
+            functools.partial(self._clicked_since, timestamp), timeout=timeout, poll_interval=0.001
         )
 
-    def wait_has_type(self, option_type: str, timeout: float = 0.5) -> bool:
-        """Wait until menu contains an option of the specified type."""
+    def _clicked_since(self, ts: float) -> bool:
+        """Check whether a menu click event newer than ts has arrived."""
+        event_time = client.cache.get_menu_clicked_state().get("_timestamp", 0)
+        return (event_time - ts) > 0
 
-        def check_type() -> bool:
-            return self.has_type(option_type)
+    def _is_closed(self) -> bool:
+        """Check if the context menu is closed."""
+        return not self.is_open()
 
-        return timing.wait_until(check_type, timeout=timeout, poll_interval=0.001)
+    def wait_has_type(self, option_type: str, timeout: float = 0.5) -> bool:
+        """Wait until menu contains an option of the specified type."""
+        return timing.wait_until(
+            functools.partial(self.has_type, option_type), timeout=timeout, poll_interval=0.001
+        )
 
     def wait_has_option(self, option: str, timeout: float = 0.5) -> bool:
         """Wait until menu contains the specified option text."""
-
-        def check_option() -> bool:
-            return self.has_option(option)
-
-        return timing.wait_until(check_option, timeout=timeout, poll_interval=0.001)
+        return timing.wait_until(
+            functools.partial(self.has_option, option), timeout=timeout, poll_interval=0.001
+        )
 
     def open(self, timeout: float = 0.5) -> bool:
         """Open the context menu by right-clicking at current mouse position."""
@@ -102,14 +129,11 @@ class Menu:
 
     def close(self, use_cancel: bool = True, timeout: float = 1.0) -> bool:
         """Close the context menu by clicking Cancel or moving mouse away."""
-        import random
-
-        # Check if menu is open
-        if not self.is_open():
+        # One menu state read serves the open check and the geometry below
+        state = self._get_menu_info()
+        if not state.get("menu_open", False):
             return True  # Already closed
 
-        state = self._get_menu_info()
-        # Get menu state from cache
         scrollable = state.get("scrollable", False)
         menu_x = state.get("menuX", 0)
         menu_y = state.get("menuY", 0)
@@ -122,62 +146,44 @@ class Menu:
 
         if use_cancel and not scrollable:
             # Click Cancel option
-            options = self.get_options()
+            options_lower = self._get_formatted()[2]
             cancel_index = None
 
-            for i, option in enumerate(options):
-                if "cancel" in option.lower():
+            for i, option in enumerate(options_lower):
+                if "cancel" in option:
                     cancel_index = i
                     break
 
             if cancel_index is not None:
-                box = self.get_option_box(cancel_index)
+                box = self.get_option_box(cancel_index, state)
                 if box:
                     box.click()
-                    return timing.wait_until(
-                        lambda: not self.is_open(), timeout=timeout, poll_interval=0.001
-                    )
-                # Box not found, fall back to mouse move
-                use_cancel = False
-            else:
-                # Cancel not found, fall back to mouse move
-                use_cancel = False
-
-        if not use_cancel:
-            # Move mouse at least 30 pixels away from menu box
-            menu_x1 = menu_x
-            menu_y1 = menu_y
-            menu_x2 = menu_x + menu_width
-            menu_y2 = menu_y + menu_height
-
-            # Pick a random direction and move 30-50 pixels away
-            distance = random.randint(30, 50)
-
-            # Randomly choose a direction: up, down, left, or right
-            direction = random.choice(["up", "down", "left", "right"])
-
-            if direction == "up":
-                target_x = random.randint(menu_x1, menu_x2)
-                target_y = menu_y1 - distance
-            elif direction == "down":
-                target_x = random.randint(menu_x1, menu_x2)
-                target_y = menu_y2 + distance
-            elif direction == "left":
-                target_x = menu_x1 - distance
-                target_y = random.randint(menu_y1, menu_y2)
-            else:  # right
-                target_x = menu_x2 + distance
-                target_y = random.randint(menu_y1, menu_y2)
-
-            # Move mouse to target position
-            client.input.mouse.move_to(target_x, target_y, safe=False)
-
-            return timing.wait_until(
-                lambda: not self.is_open(), timeout=timeout, poll_interval=0.001
-            )
-
-        # Fallback - should not reach here in normal execution
-        return timing.wait_until(lambda: not self.is_open(), timeout=timeout, poll_interval=0.001)
+                    return timing.wait_until(self._is_closed, timeout=timeout, poll_interval=0.001)
+            # Cancel or its box not found, fall back to mouse move
+
+        # Move mouse at least 30 pixels away from menu box
+        menu_x1 = menu_x
+        menu_y1 = menu_y
+        menu_x2 = menu_x + menu_width
+        menu_y2 = menu_y + menu_height
+
+        # Pick a random direction and move 30-50 pixels away
+        distance = random.randint(30, 50)
+        along_x = random.randint(menu_x1, menu_x2)
+        along_y = random.randint(menu_y1, menu_y2)
+
+        # Randomly choose a direction: up, down, left, or right
+        target_x, target_y = (
+            (along_x, menu_y1 - distance),
+            (along_x, menu_y2 + distance),
+            (menu_x1 - distance, along_y),
+            (menu_x2 + distance, along_y),
+        )[random.getrandbits(2)]
+
+        # Move mouse to target position
+        client.input.mouse.move_to(target_x, target_y, safe=False)
+
+        return timing.wait_until(self._is_closed, timeout=timeout, poll_interval=0.001)
 
     def get_options(self, strip_colors: bool = True) -> list[str]:
         """Get all menu options as formatted strings in display order."""
@@ -191,42 +197,40 @@ class Menu:
 
         return menu_types
 
+    def get_left_click(self, strip_colors: bool = True) -> tuple[str | None, str | None]:
+        """Get the default menu option and its action type from one menu snapshot."""
+        options, types, _, _ = self._get_formatted(strip_colors)
+        return (options[0] if options else None, types[0] if types else None)
+
     def get_left_click_option(self, strip_colors: bool = True) -> str | None:
         """Get the default menu option (accessible with left-click)."""
-        options = self.get_options(strip_colors=strip_colors)
-        if not options:
-            return None
-
-        return options[0]
+        return self.get_left_click(strip_colors)[0]
 
     def get_left_click_type(self) -> str | None:
         """Get the action type of the default menu option."""
-        types = self.get_types()
-        if not types:
-            return None
-
-        return types[0]
+        return self.get_left_click()[1]
 
     def has_option(self, option_text: str, strip_colors: bool = True) -> bool:
         """Check if a menu option exists (partial matching, case-insensitive)."""
-        options = self.get_options(strip_colors=strip_colors)
+        options_lower = self._get_formatted(strip_colors)[2]
         option_text_lower = option_text.lower()
 
-        return any(option_text_lower in option.lower() for option in options)
+        return any(option_text_lower in option for option in options_lower)
 
     def has_type(self, option_type: str) -> bool:
         """Check if a menu option of a specific type exists."""
-        types = self.get_types()
+        types_lower = self._get_formatted()[3]
         option_type_lower = option_type.lower()
-        return any(option_type_lower in t.lower() for t in types)
+        return any(option_type_lower in t for t in types_lower)
 
-    def get_option_box(self, option_index: int) -> Box | None:
+    def get_option_box(self, option_index: int, state: dict | None = None) -> Box | None:
         """Get the clickable box for a specific menu option by index."""
-        if not self.is_open():
+        # Callers that already hold a menu state pass it in to skip another cache read
+        if state is None:
+            state = self._get_menu_info()
+        if not state.get("menu_open", False):
             return None
 
-        state = self._get_menu_info()
-
         # Get menu position and dimensions
         menu_x = state.get("menuX", 0)
         menu_y = state.get("menuY", 0)
@@ -249,12 +253,13 @@ class Menu:
         if not self.open():
             return False
 
-        options = self.get_options()
-        option_text_lower = option_text.lower()
+        return self._hover_match(option_text.lower(), self._get_menu_info())
 
-        for i, option in enumerate(options):
-            if option_text_lower in option.lower():
-                box = self.get_option_box(i)
+    def _hover_match(self, option_text_lower: str, state: dict) -> bool:
+        """Hover the first option containing option_text_lower using an open menu state."""
+        for i, option in enumerate(self._get_formatted()[2]):
+            if option_text_lower in option:
+                box = self.get_option_box(i, state)
                 if box:
                     box.hover()
                     return True
@@ -292,29 +297,36 @@ class Menu:
 
     def wait_menu_closed(self, timeout: float = 0.5) -> bool:
         """Wait until the menu is closed."""
-        return timing.wait_until(lambda: not self.is_open(), timeout=timeout, poll_interval=0.001)
+        return timing.wait_until(self._is_closed, timeout=timeout, poll_interval=0.001)
 
     def click_option(self, option_text: str) -> bool:
         """Click a menu option. Left-clicks if default, otherwise opens menu."""
-        if self.is_open():
-            self.hover_option(option_text)
+        # One menu state and one options snapshot drive every branch below
+        state = self._get_menu_info()
+        option_text_lower = option_text.lower()
+
+        if state.get("menu_open", False):
+            self._hover_match(option_text_lower, state)
             client.input.mouse.left_click()
             return self.wait_option_clicked(option_text) and self.wait_menu_closed()
 
-        left_click_option = self.get_left_click_option()
-        if left_click_option is None:
+        options_lower = self._get_formatted()[2]
+        if not options_lower:
             return False
 
-        if option_text.lower() in left_click_option.lower():
+        if option_text_lower in options_lower[0]:
             # It's the default! Just left-click at current position
             client.input.mouse.left_click()
             return self.wait_option_clicked(option_text)
 
-        if not self.has_option(option_text):
+        if not any(option_text_lower in option for option in options_lower):
             return False
 
-        self.open()
-        self.hover_option(option_text)
+        if not self.open():
+            return False
+
+        # The menu geometry only exists once it is open
+        self._hover_match(option_text_lower, self._get_menu_info())
         client.input.mouse.left_click()
         return self.wait_option_clicked(option_text) and self.wait_menu_closed()
 
@@ -332,9 +344,10 @@ class Menu:
 
     def click_option_type(self, option_type: str) -> bool:
         """Click a menu option by its type. Opens menu if needed."""
-        options, types = self._get_options(strip_colors=True)
-        for i, t in enumerate(types):
-            if option_type.lower() in t.lower():
+        options, _, _, types_lower = self._get_formatted()
+        option_type_lower = option_type.lower()
+        for i, t in enumerate(types_lower):
+            if option_type_lower in t:
                 return self.click_option(options[i])
         return False
 
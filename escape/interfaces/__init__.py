@@ -1,5 +1,7 @@
 """Overlay windows - bank, GE, shop, dialogue, etc."""
 
+import functools
+
 from escape.client import client
 from escape.interfaces.bank import Bank, bank
 from escape.interfaces.fairy_ring import FairyRingInterface, fairy_ring
@@ -22,18 +24,15 @@ def _get_interface_id_to_name_map() -> dict[int, str]:
     try:
         from escape.generated.constants.interface_id import InterfaceID
 
-        # Iterate over class attributes that are integers (group IDs)
-        for name in dir(InterfaceID):
+        # Read the class __dict__ once; dir() sorts and getattr() runs descriptors per name
+        for name, value in vars(InterfaceID).items():
+            if not isinstance(value, int):
+                continue
             if name.startswith("_") and not name.startswith("__"):
                 # Handle names like _100GUIDE_EGGS_OVERLAY (start with underscore + digit)
-                value = getattr(InterfaceID, name)
-                if isinstance(value, int):
-                    # Remove leading underscore for display
-                    _interface_id_to_name[value] = name[1:]
+                _interface_id_to_name[value] = name[1:]
             elif not name.startswith("_") and name.isupper():
-                value = getattr(InterfaceID, name)
-                if isinstance(value, int):
-                    _interface_id_to_name[value] = name
+                _interface_id_to_name[value] = name
     except ImportError:
         pass
 
@@ -112,8 +111,19 @@ class Interfaces:
         return cls._instance
 
     def _init(self):
-        self.spirit_tree = ScrollInterface()
-        self.mushtree = GeneralInterface(
+        """Actual initialization, runs once."""
+        # Overlays are cached properties built on first access; a session usually
+        # touches only one or two of them
+
+    @functools.cached_property
+    def spirit_tree(self) -> ScrollInterface:
+        """Spirit tree destination list."""
+        return ScrollInterface()
+
+    @functools.cached_property
+    def mushtree(self) -> GeneralInterface:
+        """Fossil Island mushtree destination list."""
+        return GeneralInterface(
             client.interface_id.FOSSIL_MUSHTREES,
             [
                 client.interface_id.FossilMushtrees.TREE1,
@@ -125,8 +135,16 @@ class Interfaces:
             wrong_text="Not yet",
             menu_text="Continue",
         )
-        self.zeah_minecart = ScrollInterface()
-        self.jewellery_box = GeneralInterface(
+
+    @functools.cached_property
+    def zeah_minecart(self) -> ScrollInterface:
+        """Lovakengj minecart destination list."""
+        return ScrollInterface()
+
+    @functools.cached_property
+    def jewellery_box(self) -> GeneralInterface:
+        """POH jewellery box teleports."""
+        return GeneralInterface(
             client.interface_id.POH_JEWELLERY_BOX,
             [
                 client.interface_id.PohJewelleryBox.DUELING,
@@ -139,14 +157,26 @@ class Interfaces:
             get_children=True,
             wrong_text="</str>",
         )
-        self.gnome_glider = GliderInterface()
-        self.charter_ship = GeneralInterface(
+
+    @functools.cached_property
+    def gnome_glider(self) -> GliderInterface:
+        """Gnome glider map."""
+        return GliderInterface()
+
+    @functools.cached_property
+    def charter_ship(self) -> GeneralInterface:
+        """Charter ship destination list."""
+        return GeneralInterface(
             client.interface_id.CHARTERING_MENU_SIDE,
             [client.interface_id.CharteringMenuSide.LIST_CONTENT],
             get_children=True,
             scrollbox=client.interface_id.CharteringMenuSide.LIST_CONTENT,
         )
-        self.quetzal = GeneralInterface(
+
+    @functools.cached_property
+    def quetzal(self) -> GeneralInterface:
+        """Quetzal transport map."""
+        return GeneralInterface(
             client.interface_id.QUETZAL_MENU,
             [client.interface_id.QuetzalMenu.ICONS],
             get_children=True,
@@ -165,18 +195,13 @@ class Interfaces:
 
     def get_open_interfaces(self) -> list[int]:
         """Get a list of currently open interface IDs."""
-        return list(client.cache.get_open_widgets())
+        # get_open_widgets() already builds a fresh list
+        return client.cache.get_open_widgets()
 
     def get_open_interface_names(self) -> list[str]:
         """Get a list of currently open interface names."""
-        names = []
-        for group_id in self.get_open_interfaces():
-            name = get_interface_name(group_id)
-            if name:
-                names.append(name)
-            else:
-                names.append(f"UNKNOWN_{group_id}")
-        return names
+        name_map = _get_interface_id_to_name_map()
+        return [name_map.get(gid) or f"UNKNOWN_{gid}" for gid in client.cache.get_open_widgets()]
 
 
 # Module-level instance
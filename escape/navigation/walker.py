@@ -1,16 +1,28 @@
 """Walker module - handles walking from point A to point B with target tracking."""
 
+import time
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from escape.client import client
+from escape.navigation.pathfinder import pathfinder
+from escape.world.scene import scene
+
 if TYPE_CHECKING:
     from escape.types import Quad
     from escape.types.path import Path
+    from escape.world.projection import TileGrid
 
 # Local coordinate units per tile (RuneLite LocalPoint)
 LOCAL_UNITS_PER_TILE = 128
 
+# Seconds a computed path is reused while the player stays in the same 8x8 tile bucket
+PATH_CACHE_TTL = 0.5
+
+# Below this many visible tiles, _select_walk_tile scans in Python instead of NumPy
+SCALAR_SELECT_MAX_TILES = 16
+
 
 class Walker:
     """Walker for navigating with smart target tracking."""
@@ -25,57 +37,63 @@ class Walker:
 
     def _init(self):
         """Actual initialization, runs once."""
-        pass
+        # Last pathfinder result, keyed by destination and coarse player position
+        self._last_path_key: tuple[int, int, int, int, int] | None = None
+        self._last_path: Path | None = None
+        self._last_path_time: float = 0.0
+
+    def _get_path(
+        self, dest_x: int, dest_y: int, dest_plane: int, player_x: int, player_y: int
+    ) -> "Path | None":
+        """Get a path to the destination, reusing a recent one while nearly stationary."""
+        key = (dest_x, dest_y, dest_plane, player_x >> 3, player_y >> 3)
+        now = time.monotonic()
+        if key == self._last_path_key and now - self._last_path_time < PATH_CACHE_TTL:
+            return self._last_path
+
+        path = pathfinder.get_path(dest_x, dest_y, dest_plane)
+        self._last_path_key = key
+        self._last_path = path
+        self._last_path_time = now
+        return path
 
     def _get_player_position(self) -> tuple[int, int, int] | None:
         """Get player world position (x, y, plane) from cache."""
-        from escape.client import client
-
         pos = client.cache.position
         if pos is None:
             return None
-        return (pos.get("x", 0), pos.get("y", 0), pos.get("plane", 0))
+        # The cache only hands out fully populated position dicts
+        return pos["x"], pos["y"], pos["plane"]
 
     def _get_player_scene_position(self) -> tuple[int, int] | None:
         """Get player scene position (scene_x, scene_y) from cache."""
-        from escape.client import client
-
         pos = client.cache.scene_position
         if pos is None:
             return None
-        return (pos.get("sceneX", 0), pos.get("sceneY", 0))
+        return pos["sceneX"], pos["sceneY"]
 
     def _get_target_scene_position(self) -> tuple[int, int] | None:
         """Get current walk target in scene coordinates."""
-        from escape.client import client
-
         target = client.cache.target_location
         if target is None:
             return None
 
-        local_x = target.get("x")
-        local_y = target.get("y")
-        if local_x is None or local_y is None:
-            return None
-
         # Convert local to scene coords (128 local units = 1 tile)
-        scene_x = local_x // LOCAL_UNITS_PER_TILE
-        scene_y = local_y // LOCAL_UNITS_PER_TILE
-
-        return (scene_x, scene_y)
+        return target["x"] // LOCAL_UNITS_PER_TILE, target["y"] // LOCAL_UNITS_PER_TILE
 
     def _distance_to_target(self) -> int | None:
         """Get Chebyshev distance from player to current walk target."""
-        player_pos = self._get_player_scene_position()
-        target_pos = self._get_target_scene_position()
-
-        if player_pos is None or target_pos is None:
+        # Called on every walk poll, so read the cache dicts directly instead of
+        # going through the tuple-building position helpers
+        pos = client.cache.scene_position
+        target = client.cache.target_location
+        if pos is None or target is None:
             return None
 
-        player_x, player_y = player_pos
-        target_x, target_y = target_pos
-
-        return max(abs(target_x - player_x), abs(target_y - player_y))
+        return max(
+            abs(target["x"] // LOCAL_UNITS_PER_TILE - pos["sceneX"]),
+            abs(target["y"] // LOCAL_UNITS_PER_TILE - pos["sceneY"]),
+        )
 
     def has_target(self) -> bool:
         """Check if player currently has a walk target."""
@@ -95,20 +113,7 @@ class Walker:
 
     def _find_first_obstacle_index(self, path: "Path") -> int:
         """Find the index of the first obstacle on the path."""
-        if not path.has_obstacles():
-            return path.length()
-
-        # Find the earliest obstacle origin
-        first_obstacle_idx = path.length()
-        for obstacle in path.obstacles:
-            # Find where this obstacle's origin is on the path
-            matches = np.where(path.packed == obstacle.origin.packed)[0]
-            if len(matches) > 0:
-                idx = int(matches[0])
-                if idx < first_obstacle_idx:
-                    first_obstacle_idx = idx
-
-        return first_obstacle_idx
+        return path.get_first_obstacle_index()
 
     def _select_walk_tile(
         self,
@@ -119,20 +124,26 @@ class Walker:
         max_index: int,
     ) -> int | None:
         """Select the optimal tile to click for walking (visible, clickable, far enough)."""
-        from escape.world.scene import scene
-
         # Filter to tiles before obstacle
         valid_indices = visible_indices[visible_indices < max_index]
 
         if len(valid_indices) == 0:
             return None
 
+        # Array setup dominates for short lists; walk them back to front instead
+        if len(valid_indices) < SCALAR_SELECT_MAX_TILES:
+            grid = scene._get_tile_grid()
+            if grid is None:
+                return None
+            return self._select_walk_tile_scalar(path, valid_indices, player_x, player_y, grid)
+
+        # Chebyshev distance from player, computed once and narrowed alongside the indices
+        dist = path.distance_to_tile(player_x, player_y)[valid_indices]
+
         # Filter by Chebyshev distance <= 19 (same as Java isTileClickable)
-        world_x = path.world_x[valid_indices]
-        world_y = path.world_y[valid_indices]
-        dist = np.maximum(np.abs(world_x - player_x), np.abs(world_y - player_y))
         within_range = dist <= 19
         valid_indices = valid_indices[within_range]
+        dist = dist[within_range]
 
         if len(valid_indices) == 0:
             return None
@@ -143,49 +154,75 @@ class Walker:
             return None
 
         # Filter to tiles whose quad is FULLY inside viewport (all 4 corners)
-        clickable_indices = []
-        for idx in valid_indices:
-            quad = path.get_quad(int(idx))
-            if quad is not None:
-                # Check all 4 vertices are inside viewport
-                all_inside = all(
-                    grid.view_min_x <= p.x <= grid.view_max_x
-                    and grid.view_min_y <= p.y <= grid.view_max_y
-                    for p in quad.vertices
-                )
-                if all_inside:
-                    clickable_indices.append(int(idx))
-
-        if len(clickable_indices) == 0:
+        corner_x, corner_y, in_scene = path.get_quad_corners(valid_indices)
+        clickable = in_scene & (
+            (corner_x >= grid.view_min_x)
+            & (corner_x <= grid.view_max_x)
+            & (corner_y >= grid.view_min_y)
+            & (corner_y <= grid.view_max_y)
+        ).all(axis=1)
+        if not clickable.any():
             return None
 
-        clickable_indices = np.array(clickable_indices)
+        # Work on the mask directly instead of copying out the clickable subset;
+        # unclickable tiles get distance -1 so they never pass either pick below
+        dist = np.where(clickable, dist, -1)
 
-        # Get world coordinates for clickable tiles
-        world_x = path.world_x[clickable_indices]
-        world_y = path.world_y[clickable_indices]
+        # Among tiles at least 3 tiles away, pick the one furthest along the path
+        far_enough = np.flatnonzero(dist >= 3)
+        if len(far_enough) > 0:
+            return int(valid_indices[far_enough[-1]])
 
-        # Calculate distance from player (Chebyshev)
-        dist = np.maximum(np.abs(world_x - player_x), np.abs(world_y - player_y))
+        # If all tiles are close, just pick the furthest
+        return int(valid_indices[int(np.argmax(dist))])
 
-        # Filter out tiles too close (< 3 tiles away)
-        far_enough = dist >= 3
-        if not far_enough.any():
-            # If all tiles are close, just pick the furthest
-            best_local = int(np.argmax(dist))
-            return int(clickable_indices[best_local])
+    def _select_walk_tile_scalar(
+        self,
+        path: "Path",
+        valid_indices: np.ndarray,
+        player_x: int,
+        player_y: int,
+        grid: "TileGrid",
+    ) -> int | None:
+        """Select the walk tile like _select_walk_tile, scanning a short index list in Python."""
+        packed = path.packed
+        close = []
+
+        # The furthest clickable tile at least 3 tiles away wins outright
+        for idx in reversed(valid_indices.tolist()):
+            p = int(packed[idx])
+            world_x = p & 0x7FFF
+            world_y = (p >> 15) & 0x7FFF
+            dist = max(abs(world_x - player_x), abs(world_y - player_y))
+            if dist > 19:
+                continue
+            if dist < 3:
+                close.append((dist, idx, world_x, world_y))
+            elif self._is_tile_fully_visible(grid, world_x, world_y):
+                return idx
+
+        # All clickable tiles are close: pick the furthest, earliest on ties
+        close.sort(key=lambda c: (-c[0], c[1]))
+        for _, idx, world_x, world_y in close:
+            if self._is_tile_fully_visible(grid, world_x, world_y):
+                return idx
+
+        return None
+
+    def _is_tile_fully_visible(self, grid: "TileGrid", world_x: int, world_y: int) -> bool:
+        """Check that all 4 corners of a world tile lie inside the viewport."""
+        scene_x = world_x - grid.base_x
+        scene_y = world_y - grid.base_y
+        if not (0 <= scene_x < grid.size_x and 0 <= scene_y < grid.size_y):
+            return False
 
-        # Among far enough tiles, pick the one furthest along the path
-        # (which is the highest index in clickable_indices)
-        far_mask = np.array(far_enough)
-        far_indices = clickable_indices[far_mask]
-        return int(far_indices[-1])  # Last one is furthest along path
+        corners = grid.get_tile_corners(scene_x * grid.size_y + scene_y)
+        return all(grid.view_min_x <= x <= grid.view_max_x for x in corners[0::2]) and all(
+            grid.view_min_y <= y <= grid.view_max_y for y in corners[1::2]
+        )
 
     def click_tile(self, world_x: int, world_y: int) -> bool:
         """Click a specific world tile to walk to it."""
-        from escape.client import client
-        from escape.world.scene import scene
-
         # Get the quad for this tile
         quad = scene.get_tile_quad(world_x, world_y)
         if quad is None:
@@ -210,8 +247,6 @@ class Walker:
         near_target_threshold: int = 2,
     ) -> bool:
         """Walk towards destination by clicking a tile along the path."""
-        from escape.navigation.pathfinder import pathfinder
-
         # Get player position
         player_pos = self._get_player_position()
         if player_pos is None:
@@ -229,7 +264,7 @@ class Walker:
             return True  # Return True because we're making progress
 
         # Get path to destination
-        path = pathfinder.get_path(dest_x, dest_y, dest_plane)
+        path = self._get_path(dest_x, dest_y, dest_plane, player_x, player_y)
         if path is None or path.is_empty():
             return False
 
@@ -259,8 +294,6 @@ class Walker:
 
     def _click_walk_quad(self, quad: "Quad") -> bool:
         """Hover over quad and click with WALK action."""
-        from escape.client import client
-
         # Hover on the tile
         quad.hover()
 
@@ -277,12 +310,11 @@ class Walker:
 
     def distance_to_destination(self, dest_x: int, dest_y: int) -> int:
         """Get Chebyshev distance from player to destination (-1 if unknown)."""
-        player_pos = self._get_player_position()
-        if player_pos is None:
+        pos = client.cache.position
+        if pos is None:
             return -1
 
-        player_x, player_y, _ = player_pos
-        return max(abs(dest_x - player_x), abs(dest_y - player_y))
+        return max(abs(dest_x - pos["x"]), abs(dest_y - pos["y"]))
 
 
 # Module-level instance
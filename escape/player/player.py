@@ -2,38 +2,51 @@
 
 from typing import Any, ClassVar, Self
 
+from escape.client import client
+
 
 class Player:
     """Player state accessor for position, energy, and game tick."""
 
+    # Slots turn the per-tick fields into fixed-offset reads instead of __dict__ lookups
+    __slots__ = ("_cached_state", "_cached_tick", "_plane", "_x", "_y")
+
     _instance: ClassVar[Self | None] = None
     _cached_state: dict[str, Any]
     _cached_tick: int
+    _x: int
+    _y: int
+    _plane: int
 
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._cached_state = {}
             cls._instance._cached_tick = -1
+            cls._instance._x = cls._instance._y = cls._instance._plane = 0
         return cls._instance
 
-    def _get_state(self) -> dict[str, Any]:
-        """Get cached player state (refreshed per tick)."""
-        from escape.client import client
-
+    def _refresh(self) -> None:
+        """Refresh cached player state once per tick."""
         current_tick = client.cache.tick
 
-        # Return cached if same tick
+        # Keep cached if same tick
         if self._cached_tick == current_tick and self._cached_state:
-            return self._cached_state
+            return
 
-        # Refresh from cache
+        # The cache builds a fresh, fully populated dict on every read, so no copy
         position = client.cache.position
         if position is not None:
-            self._cached_state = position.copy()
+            self._cached_state = position
+            self._x = position["x"]
+            self._y = position["y"]
+            self._plane = position["plane"]
         if current_tick is not None:
             self._cached_tick = current_tick
 
+    def _get_state(self) -> dict[str, Any]:
+        """Get cached player state (refreshed per tick)."""
+        self._refresh()
         return self._cached_state
 
     @property
@@ -44,51 +57,60 @@ class Player:
     @property
     def x(self) -> int:
         """Get player X coordinate."""
-        return self._get_state().get("x", 0)
+        self._refresh()
+        return self._x
 
     @property
     def y(self) -> int:
         """Get player Y coordinate."""
-        return self._get_state().get("y", 0)
+        self._refresh()
+        return self._y
 
     @property
     def plane(self) -> int:
         """Get player plane level."""
-        return self._get_state().get("plane", 0)
+        self._refresh()
+        return self._plane
 
     @property
     def energy(self) -> int:
         """Get run energy (0-10000)."""
-        from escape.client import client
-
         return client.cache.energy or 0
 
     @property
     def tick(self) -> int:
         """Get current game tick."""
-        from escape.client import client
-
         return client.cache.tick or 0
 
     def distance_to(self, x: int, y: int) -> int:
         """Calculate distance from player to coordinates."""
-        dx = abs(self.x - x)
-        dy = abs(self.y - y)
-        return max(dx, dy)
+        # Inline Chebyshev on the cached ints; no abs()/max() calls or property hops
+        self._refresh()
+        dx = self._x - x
+        dy = self._y - y
+        if dx < 0:
+            dx = -dx
+        if dy < 0:
+            dy = -dy
+        return dx if dx > dy else dy
 
     def is_at(self, x: int, y: int, plane: int | None = None) -> bool:
         """Check if player is at specific coordinates."""
-        if self.x != x or self.y != y:
+        self._refresh()
+        if self._x != x or self._y != y:
             return False
 
-        return not (plane is not None and self.plane != plane)
+        return not (plane is not None and self._plane != plane)
 
     def is_nearby(self, x: int, y: int, radius: int, plane: int | None = None) -> bool:
         """Check if player is within radius of coordinates."""
-        if plane is not None and self.plane != plane:
+        self._refresh()
+        if plane is not None and self._plane != plane:
             return False
 
-        return self.distance_to(x, y) <= radius
+        dx = self._x - x
+        dy = self._y - y
+        return -radius <= dx <= radius and -radius <= dy <= radius
 
 
 # Module-level instance
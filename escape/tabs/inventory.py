@@ -1,5 +1,6 @@
 """Inventory tab module."""
 
+from escape.client import client
 from escape.types.box import Box, create_grid
 from escape.types.gametab import GameTab, GameTabs
 from escape.types.item import Item, ItemIdentifier
@@ -28,27 +29,30 @@ class Inventory(GameTabs, ItemContainer):
         self.containerId = self.INVENTORY_ID
         self.slotCount = 28
         self._items = []
+        # Shift-drop setting from the last varbit read, reused within one game tick
+        self._shift_drop_tick = -1
+        self._shift_drop = False
 
         # Create inventory slot grid (4 columns x 7 rows, 28 slots total)
         # Slot 0 starts at (563, 213), each slot is 36x32 pixels with 6px horizontal spacing
         # 2px padding on all sides to avoid misclicks on edges
-        self.slots = create_grid(
-            start_x=563,
-            start_y=213,
-            width=36,
-            height=32,
-            columns=4,
-            rows=7,
-            spacing_x=6,
-            spacing_y=4,  # Vertical spacing between rows
-            padding=1,  # 2px padding on all sides to avoid edge misclicks
+        self.slots = tuple(
+            create_grid(
+                start_x=563,
+                start_y=213,
+                width=36,
+                height=32,
+                columns=4,
+                rows=7,
+                spacing_x=6,
+                spacing_y=4,  # Vertical spacing between rows
+                padding=1,  # 2px padding on all sides to avoid edge misclicks
+            )
         )
 
     @property
     def items(self) -> list[Item | None]:
         """Auto-sync items from cache when accessed."""
-        from escape.client import client
-
         cached = client.cache.get_item_container(self.INVENTORY_ID)
         if cached is None:
             self._items = []
@@ -62,15 +66,13 @@ class Inventory(GameTabs, ItemContainer):
 
     def hover_slot(self, slot_index: int) -> bool:
         """Hover over a specific inventory slot (0-27)."""
-        if 0 <= slot_index < 28:
+        if 0 <= slot_index < self.slotCount:
             self.slots[slot_index].hover()
             return True
         return False
 
     def hover_item(self, identifier: ItemIdentifier) -> bool:
         """Hover over an item by ID or name."""
-        from escape.client import client
-
         found_slots = self.find_item_slots(identifier)
         if not found_slots:
             return False
@@ -84,8 +86,6 @@ class Inventory(GameTabs, ItemContainer):
         self, slot_index: int, option: str | None = None, type: str | None = None
     ) -> bool:
         """Click a specific inventory slot, optionally selecting a menu option."""
-        from escape.client import client
-
         if not self.hover_slot(slot_index):
             return False
 
@@ -112,23 +112,30 @@ class Inventory(GameTabs, ItemContainer):
 
     def is_shift_drop_enabled(self) -> bool:
         """Check if shift-click drop is enabled in game settings."""
-        from escape.client import client
+        tick = client.cache.tick
+        if tick is not None and tick == self._shift_drop_tick:
+            return self._shift_drop
 
         varbit_value = client.resources.varps.get_varbit_by_name("DESKTOP_SHIFTCLICKDROP_ENABLED")
-        return varbit_value == 1
+        self._shift_drop = varbit_value == 1
+        if tick is not None:
+            self._shift_drop_tick = tick
+        return self._shift_drop
 
     def wait_drop_option(self, timeout: float = 0.5) -> bool:
         """Wait until 'Drop' option appears in menu."""
         import time
 
-        from escape.client import client
+        has_option = client.interactions.menu.has_option
+        deadline = time.monotonic() + timeout
+        interval = 0.001
 
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if client.interactions.menu.has_option("Drop"):
+        while time.monotonic() < deadline:
+            if has_option("Drop"):
                 return True
-            time.sleep(0.001)  # Small delay before checking again
+            # Back off from 1ms to 10ms so long waits don't spin through hundreds of polls
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.01)
 
         return False
 
@@ -160,8 +167,6 @@ class Inventory(GameTabs, ItemContainer):
         """Drop items from specific slot indices. Returns count dropped."""
         from time import sleep
 
-        from escape.client import client
-
         if not slot_indices:
             return 0
 
@@ -176,14 +181,19 @@ class Inventory(GameTabs, ItemContainer):
             keyboard.hold("shift")
             sleep(0.025)
 
+        # Resolve the per-slot calls once rather than on every iteration
+        hover_slot = self.hover_slot
+        wait_drop_option = self.wait_drop_option
+        click_option = client.interactions.menu.click_option
+
         try:
             for slot_index in slot_indices:
-                self.hover_slot(slot_index)
+                hover_slot(slot_index)
 
-                if not self.wait_drop_option():
+                if not wait_drop_option():
                     continue
 
-                if client.interactions.menu.click_option("Drop"):
+                if click_option("Drop"):
                     dropped_count += 1
         finally:
             if use_shift_drop:
@@ -195,12 +205,8 @@ class Inventory(GameTabs, ItemContainer):
     def select_slot(self, slot_index: int) -> bool:
         """Select a slot for 'Use item on...' actions."""
         import escape.utilities.timing as timing
-        from escape.client import client
 
-        if not (0 <= slot_index < 28):
-            return False
-
-        # Click the item to select it
+        # Click the item to select it (hover_slot rejects out-of-range slots)
         if not self.hover_slot(slot_index):
             return False
         if not client.interactions.menu.wait_has_type("WIDGET_TARGET"):
@@ -211,24 +217,18 @@ class Inventory(GameTabs, ItemContainer):
 
     def is_item_selected(self) -> bool:
         """Check if an item is currently selected."""
-        from escape.client import client
-
         widget = client.cache.get_last_selected_widget()
         id = widget.get("selected_widget_id", -1)
         return id == client.interface_id.Inventory.ITEMS
 
     def get_selected_item_slot(self) -> int:
         """Get the slot index of the currently selected item, or -1 if none."""
-        from escape.client import client
-
         widget = client.cache.get_last_selected_widget()
         selected_index = widget.get("index", -1)
         return selected_index
 
     def unselect_item(self) -> bool:
         """Unselect the currently selected item."""
-        from escape.client import client
-
         if not self.is_item_selected():
             return True
 
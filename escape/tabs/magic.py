@@ -1,10 +1,46 @@
 """Magic tab module."""
 
+import functools
+
 from escape._internal.logger import logger
 from escape.client import client
 from escape.types.box import Box
 from escape.types.gametab import GameTab, GameTabs
-from escape.types.widget import Widget, WidgetFields
+from escape.types.widget import Widget, WidgetBits, WidgetFields
+
+
+@functools.cache
+def _get_spell_sprite_sets() -> tuple[frozenset[int], frozenset[int]]:
+    """Get the (on, off) spell sprite ID sets across all spellbooks."""
+    magic_on_classes = [
+        client.sprite_id.Magicon,
+        client.sprite_id._2XStandardSpellsOn,
+        client.sprite_id.Magicon2,
+        client.sprite_id._2XAncientSpellsOn,
+        client.sprite_id._2XLunarSpellsOn,
+        client.sprite_id.LunarMagicOn,
+        client.sprite_id.MagicNecroOn,
+        client.sprite_id._2XNecroSpellsOn,
+    ]
+
+    magic_off_classes = [
+        client.sprite_id.Magicoff,
+        client.sprite_id._2XStandardSpellsOff,
+        client.sprite_id.Magicoff2,
+        client.sprite_id._2XAncientSpellsOff,
+        client.sprite_id._2XLunarSpellsOff,
+        client.sprite_id.LunarMagicOff,
+        client.sprite_id.MagicNecroOff,
+        client.sprite_id._2XNecroSpellsOff,
+    ]
+
+    on_sprites = frozenset(
+        v for cls in magic_on_classes for v in vars(cls).values() if isinstance(v, int)
+    )
+    off_sprites = frozenset(
+        v for cls in magic_off_classes for v in vars(cls).values() if isinstance(v, int)
+    )
+    return on_sprites, off_sprites
 
 
 class Magic(GameTabs):
@@ -24,46 +60,22 @@ class Magic(GameTabs):
         """Actual initialization, runs once."""
         GameTabs.__init__(self)
 
-        magic_on_classes = [
-            client.sprite_id.Magicon,
-            client.sprite_id._2XStandardSpellsOn,
-            client.sprite_id.Magicon2,
-            client.sprite_id._2XAncientSpellsOn,
-            client.sprite_id._2XLunarSpellsOn,
-            client.sprite_id.LunarMagicOn,
-            client.sprite_id.MagicNecroOn,
-            client.sprite_id._2XNecroSpellsOn,
-        ]
-
-        magic_off_classes = [
-            client.sprite_id.Magicoff,
-            client.sprite_id._2XStandardSpellsOff,
-            client.sprite_id.Magicoff2,
-            client.sprite_id._2XAncientSpellsOff,
-            client.sprite_id._2XLunarSpellsOff,
-            client.sprite_id.LunarMagicOff,
-            client.sprite_id.MagicNecroOff,
-            client.sprite_id._2XNecroSpellsOff,
-        ]
-
-        self.on_sprites = {
-            v for cls in magic_on_classes for v in vars(cls).values() if isinstance(v, int)
-        }
-        self.off_sprites = {
-            v for cls in magic_off_classes for v in vars(cls).values() if isinstance(v, int)
-        }
+        self.on_sprites, self.off_sprites = _get_spell_sprite_sets()
 
         self.spells = client.interface_id.MagicSpellbook
 
-        self._allSpellWidgets = []
+        # Every spellbook slot, queried for its sprite only; plain IDs avoid a Widget per slot
+        self._spell_ids = list(
+            range(
+                client.interface_id.MagicSpellbook.SPELLLAYER + 1,
+                client.interface_id.MagicSpellbook.INFOLAYER,
+            )
+        )
+        self._sprite_mask = WidgetBits.get_sprite_id
 
-        for i in range(
-            client.interface_id.MagicSpellbook.SPELLLAYER + 1,
-            client.interface_id.MagicSpellbook.INFOLAYER,
-        ):
-            w = Widget(i)
-            w.enable(WidgetFields.get_sprite_id)
-            self._allSpellWidgets.append(w)
+        # Castable sprite IDs from the last widget batch, reused within one game tick
+        self._castable_tick = -1
+        self._castable: frozenset[int] = frozenset()
 
     def _get_info(self, spell: int):
         """Get spell info widget by spell ID."""
@@ -75,12 +87,19 @@ class Magic(GameTabs):
 
     def _get_all_visible_sprites(self):
         """Get all visible spell sprites."""
-        res = Widget.get_batch(self._allSpellWidgets)
+        res = Widget.get_batch_ids(self._spell_ids, self._sprite_mask)
         return [w["spriteId"] for w in res]
 
-    def get_castable_spell_ids(self):
-        vis = self._get_all_visible_sprites()
-        return set(vis).intersection(self.on_sprites)
+    def get_castable_spell_ids(self) -> frozenset[int]:
+        """Get sprite IDs of castable spells (one widget batch per game tick)."""
+        tick = client.cache.tick
+        if tick is not None and tick == self._castable_tick:
+            return self._castable
+
+        self._castable = self.on_sprites.intersection(self._get_all_visible_sprites())
+        if tick is not None:
+            self._castable_tick = tick
+        return self._castable
 
     def _can_cast_spell(self, sprite_id: int) -> bool:
         """Check if a spell can be cast by its widget ID.
@@ -104,7 +123,6 @@ class Magic(GameTabs):
         if self._can_cast_spell(w["spriteId"]) and not w["is_hidden"]:
             bounds = w["bounds"]
             box = Box(bounds[0], bounds[1], bounds[0] + bounds[2], bounds[1] + bounds[3])
-            print(box)
             logger.info(f"part 2 took {time() - t:.4f}s")
             res = box.click_option(option)
             logger.info(f"part 3 took {time() - t:.4f}s")
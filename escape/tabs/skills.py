@@ -1,8 +1,11 @@
 """Skills tab module."""
 
+from types import MappingProxyType
+
+from escape.client import client
 from escape.types.gametab import GameTab, GameTabs
 
-SKILL_NAMES: list[str] = [
+SKILL_NAMES: tuple[str, ...] = (
     "Attack",
     "Defence",
     "Strength",
@@ -27,7 +30,12 @@ SKILL_NAMES: list[str] = [
     "Hunter",
     "Construction",
     "Sailing",
-]
+)
+
+# Skill name -> position in SKILL_NAMES (the client's skill order)
+SKILL_INDEX: MappingProxyType[str, int] = MappingProxyType(
+    {name: index for index, name in enumerate(SKILL_NAMES)}
+)
 
 
 class Skills(GameTabs):
@@ -48,12 +56,35 @@ class Skills(GameTabs):
         GameTabs.__init__(self)
         self._last_total_xp: int | None = None
 
+        # Last skills snapshot and its totals, keyed by the identity of each skill dict
+        self._skills_key: tuple[int, ...] = ()
+        self._skills_data: dict[str, dict[str, int]] = {}
+        self._total_level = 0
+        self._total_xp = 0
+
+    def _refresh(self) -> dict[str, dict[str, int]]:
+        """Take a skills snapshot, re-summing totals only when a skill changed."""
+        data = client.cache.get_all_skills()
+
+        # stat_changed replaces a skill's dict, so unchanged identities mean unchanged
+        # values; holding the previous snapshot keeps those ids from being reused
+        key = tuple(map(id, data.values()))
+        if key != self._skills_key:
+            total_level = total_xp = 0
+            for skill in data.values():
+                total_level += skill["level"]
+                total_xp += skill["xp"]
+            self._total_level = total_level
+            self._total_xp = total_xp
+            self._skills_key = key
+
+        self._skills_data = data
+        return data
+
     def _get_skill_data(self, skill_name: str) -> dict[str, int]:
         """Get skill data from cache."""
-        from escape.client import client
-
         # Get from cache
-        data = client.cache.get_all_skills().get(skill_name)
+        data = self._refresh().get(skill_name)
         if data:
             return data
 
@@ -74,17 +105,13 @@ class Skills(GameTabs):
 
     def get_total_level(self) -> int:
         """Get total level across all skills."""
-        from escape.client import client
-
-        skills_data = client.cache.get_all_skills()
-        return sum(data["level"] for data in skills_data.values())
+        self._refresh()
+        return self._total_level
 
     def get_total_experience(self) -> int:
         """Get total experience across all skills."""
-        from escape.client import client
-
-        skills_data = client.cache.get_all_skills()
-        return sum(data["xp"] for data in skills_data.values())
+        self._refresh()
+        return self._total_xp
 
     def gained_xp(self) -> bool:
         """Check if XP was gained since last check."""
@@ -8,7 +8,7 @@ from .itemcontainer import ItemContainer
 from .point import Point, Point3D
 from .polygon import Polygon
 from .quad import Quad
-from .widget import Widget, WidgetField, WidgetFields
+from .widget import Widget, WidgetBatch, WidgetBits, WidgetField, WidgetFields
 
 __all__ = [
     "Box",
@@ -23,6 +23,8 @@ __all__ = [
     "Polygon",
     "Quad",
     "Widget",
+    "WidgetBatch",
+    "WidgetBits",
     "WidgetField",
     "WidgetFields",
     "create_grid",
@@ -5,11 +5,13 @@ import random
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from escape.types.point import Point
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     """Represents a circle with integer center coordinates and float radius."""
 
@@ -29,9 +31,17 @@ class Circle:
 
     def contains(self, point: "Point") -> bool:
         """Check if a point is within this circle."""
+        # Compare squared distances; radius is a plain mutable field, so square it per call
         dx = point.x - self.center_x
         dy = point.y - self.center_y
-        return math.sqrt(dx * dx + dy * dy) <= self.radius
+        radius = self.radius
+        return dx * dx + dy * dy <= radius * radius
+
+    def contains_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Check many points at once. Returns a boolean mask."""
+        dx = np.asarray(xs) - self.center_x
+        dy = np.asarray(ys) - self.center_y
+        return dx * dx + dy * dy <= self.radius * self.radius
 
     def random_point(self) -> "Point":
         """Generate a uniformly random point within this circle."""
@@ -39,13 +49,24 @@ class Circle:
 
         # Use sqrt to get uniform distribution (not just random angle/radius)
         r = self.radius * math.sqrt(random.random())
-        theta = random.uniform(0, 2 * math.pi)
+        theta = math.tau * random.random()
 
         x = self.center_x + int(r * math.cos(theta))
         y = self.center_y + int(r * math.sin(theta))
 
         return Point(x, y)
 
+    def random_points(self, n: int) -> np.ndarray:
+        """Generate n uniformly random points within this circle as an [n, 2] (x, y) array."""
+        r = self.radius * np.sqrt(np.random.random(n))
+        theta = math.tau * np.random.random(n)
+
+        # astype truncates toward zero, matching int() in random_point
+        points = np.empty((n, 2), dtype=np.int32)
+        points[:, 0] = self.center_x + (r * np.cos(theta)).astype(np.int32)
+        points[:, 1] = self.center_y + (r * np.sin(theta)).astype(np.int32)
+        return points
+
     def click(self, button: str = "left", randomize: bool = True) -> None:
         """Click within this circle."""
         point = self.random_point() if randomize else self.center()
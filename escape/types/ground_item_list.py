@@ -2,6 +2,8 @@
 
 from collections.abc import Callable
 
+import numpy as np
+
 from .ground_item import GroundItem
 from .item import ItemIdentifier
 from .packed_position import PackedPosition
@@ -10,60 +12,123 @@ from .packed_position import PackedPosition
 class GroundItemList:
     """List of ground items with fluent filtering methods."""
 
-    def __init__(self, items: list[GroundItem]):
+    # Every filter creates a new list, so skip the per-instance __dict__
+    __slots__ = ("_columns", "_materialized", "_names_lower", "_predicates", "_source")
+
+    def __init__(
+        self,
+        items: list[GroundItem],
+        _predicates: tuple[Callable[[GroundItem], bool], ...] = (),
+        _columns: tuple[np.ndarray, ...] | None = None,
+        _names_lower: list[str] | None = None,
+    ):
         """Initialize ground item list."""
-        self._items = items
+        # Chained filters only stack predicates; the list is built in one pass on first use
+        self._source = items
+        self._predicates = _predicates
+        self._materialized: list[GroundItem] | None = None if _predicates else items
+        # Parallel (id, ownership, quantity, packed) arrays for the numeric filters and sorts
+        self._columns = _columns
+        # Case-folded item names for the name filter, also narrowed into derived lists
+        self._names_lower = _names_lower
+
+    @property
+    def _items(self) -> list[GroundItem]:
+        if self._materialized is None:
+            predicates = self._predicates
+            self._materialized = [item for item in self._source if all(p(item) for p in predicates)]
+        return self._materialized
+
+    def _get_columns(self) -> tuple[np.ndarray, ...]:
+        """Build the per-item arrays once; narrowed copies are handed to derived lists."""
+        if self._columns is None:
+            items = self._items
+            n = len(items)
+            self._columns = (
+                np.fromiter((item.id for item in items), dtype=np.int64, count=n),
+                np.fromiter((item.ownership for item in items), dtype=np.int64, count=n),
+                np.fromiter((item.quantity for item in items), dtype=np.int64, count=n),
+                # Normalized to the unsigned 32-bit layout so signed packs compare equal
+                np.fromiter((item.position.packed for item in items), dtype=np.int64, count=n)
+                & 0xFFFFFFFF,
+            )
+        return self._columns
+
+    def _select(self, index: np.ndarray) -> "GroundItemList":
+        """Return a new list of the rows picked by a boolean mask or an index order."""
+        if index.dtype == np.bool_:
+            index = np.flatnonzero(index)
+        return self._take(index.tolist())
+
+    def _take(self, index: list[int]) -> "GroundItemList":
+        """Return a new list of the given rows, narrowing whatever per-item data is built."""
+        items = self._items
+        columns = self._columns
+        names = self._names_lower
+        return GroundItemList(
+            [items[i] for i in index],
+            _columns=None if columns is None else tuple(column[index] for column in columns),
+            _names_lower=None if names is None else [names[i] for i in index],
+        )
+
+    def _with_predicate(self, predicate: Callable[[GroundItem], bool]) -> "GroundItemList":
+        """Return a lazily filtered view with one more predicate."""
+        if self._materialized is not None:
+            return GroundItemList(self._materialized, (predicate,))
+        return GroundItemList(self._source, (*self._predicates, predicate))
 
     def filter(self, predicate: Callable[[GroundItem], bool]) -> "GroundItemList":
         """Filter items by custom predicate."""
-        return GroundItemList([item for item in self._items if predicate(item)])
+        return self._with_predicate(predicate)
 
     def filter_by_item(self, identifier: ItemIdentifier) -> "GroundItemList":
         """Filter by item ID or name."""
         if isinstance(identifier, int):
-            return GroundItemList([item for item in self._items if item.id == identifier])
-        return GroundItemList(
-            [item for item in self._items if identifier.lower() in item.name.lower()]
-        )
+            return self._select(self._get_columns()[0] == identifier)
+        query = identifier.lower()
+        if self._names_lower is None:
+            self._names_lower = [item.name.lower() for item in self._items]
+        return self._take([i for i, name in enumerate(self._names_lower) if query in name])
 
     def filter_by_ownership(self, ownership: int) -> "GroundItemList":
         """Filter by ownership type."""
-        return GroundItemList([item for item in self._items if item.ownership == ownership])
+        return self._select(self._get_columns()[1] == ownership)
 
     def filter_yours(self) -> "GroundItemList":
         """Filter to only your items (ownership 1 or 3)."""
-        return GroundItemList([item for item in self._items if item.is_yours])
+        ownership = self._get_columns()[1]
+        return self._select((ownership == 1) | (ownership == 3))
 
     def filter_lootable(self) -> "GroundItemList":
         """Filter to only lootable items (yours or public)."""
-        return GroundItemList([item for item in self._items if item.can_loot])
+        ownership = self._get_columns()[1]
+        return self._select((ownership == 0) | (ownership == 1) | (ownership == 3))
 
     def filter_by_position(self, x: int, y: int, plane: int) -> "GroundItemList":
         """Filter to items at specific position."""
         target = PackedPosition(x, y, plane)
-        return GroundItemList([item for item in self._items if item.position == target])
+        return self._select(self._get_columns()[3] == target.packed)
 
     def filter_nearby(self, x: int, y: int, plane: int, radius: int) -> "GroundItemList":
         """Filter to items within radius of position."""
-        center = PackedPosition(x, y, plane)
-        return GroundItemList(
-            [
-                item
-                for item in self._items
-                if item.position.is_nearby(center, radius, same_plane=True)
-            ]
-        )
+        # Compare the bit fields in place: plane bits first, then per-axis bounds
+        packed = self._get_columns()[3]
+        mask = (packed >> 30) == plane
+        mask &= np.abs((packed & 0x7FFF) - x) <= radius
+        mask &= np.abs(((packed >> 15) & 0x7FFF) - y) <= radius
+        return self._select(mask)
 
     def sort_by_distance(self, x: int, y: int, plane: int) -> "GroundItemList":
         """Sort items by distance from position (closest first)."""
-        center = PackedPosition(x, y, plane)
-        sorted_items = sorted(self._items, key=lambda item: item.position.distance_to(center))
-        return GroundItemList(sorted_items)
+        packed = self._get_columns()[3]
+        distance = np.maximum(np.abs((packed & 0x7FFF) - x), np.abs(((packed >> 15) & 0x7FFF) - y))
+        return self._select(np.argsort(distance, kind="stable"))
 
     def sort_by_quantity(self, reverse: bool = True) -> "GroundItemList":
         """Sort items by quantity."""
-        sorted_items = sorted(self._items, key=lambda item: item.quantity, reverse=reverse)
-        return GroundItemList(sorted_items)
+        # Stable on negated keys matches sorted(..., reverse=True) tie order
+        quantity = self._get_columns()[2]
+        return self._select(np.argsort(-quantity if reverse else quantity, kind="stable"))
 
     def first(self) -> GroundItem | None:
         """Get first item in list."""
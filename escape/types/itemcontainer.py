@@ -9,6 +9,14 @@ from escape.types.item import Item, ItemIdentifier
 class ItemContainer:
     """Base class for OSRS item containers (inventory, bank, equipment, etc.)."""
 
+    # Lookup indexes and totals for the items list they were built from. Class-level
+    # default because Inventory and Bank expose items as a property and skip __init__.
+    _index_items: list[Item | None] | None = None
+    _id_index: dict[int, list[int]]
+    _name_index: dict[str, list[int]]
+    _non_empty_count: int
+    _total_quantity: int
+
     def __init__(
         self,
         container_id: int = -1,
@@ -20,7 +28,7 @@ class ItemContainer:
         self.slot_count = slot_count
         self.items = items if items is not None else []
 
-    def from_array(self, data: list[dict[str, Any]]):
+    def from_array(self, data: list[dict[str, Any] | None]):
         """Populate ItemContainer from array of item dicts."""
         parsed_items = [
             Item.from_dict(item_data) if item_data is not None else None for item_data in data
@@ -50,25 +58,72 @@ class ItemContainer:
             "items": [item.to_dict() if item is not None else None for item in self.items],
         }
 
+    def _get_index(
+        self,
+    ) -> tuple[list[Item | None], dict[int, list[int]], dict[str, list[int]]]:
+        """Get the current items list with its (id -> slots, name -> slots) indexes."""
+        # Containers are rewritten wholesale (from_array/clear), so list identity is the key
+        items = self.items
+        if items is not self._index_items:
+            id_index: dict[int, list[int]] = {}
+            name_index: dict[str, list[int]] = {}
+            non_empty_count = 0
+            total_quantity = 0
+            for slot, item in enumerate(items):
+                if item is not None:
+                    id_index.setdefault(item.id, []).append(slot)
+                    name_index.setdefault(item.name, []).append(slot)
+                    non_empty_count += 1
+                    total_quantity += item.quantity
+            self._id_index = id_index
+            self._name_index = name_index
+            self._non_empty_count = non_empty_count
+            self._total_quantity = total_quantity
+            self._index_items = items
+        return items, self._id_index, self._name_index
+
+    @staticmethod
+    def _slots_by_id(id_index: dict[int, list[int]], item_id: int) -> list[int]:
+        """Get the ascending slots holding the item ID (may be the index list)."""
+        return id_index.get(item_id, [])
+
+    @staticmethod
+    def _slots_by_name(name_index: dict[str, list[int]], name: str) -> list[int]:
+        """Get the ascending slots whose item name contains name (may be the index list)."""
+        # Substring test runs once per distinct name rather than once per slot
+        matches = [slots for key, slots in name_index.items() if name in key]
+        if len(matches) == 1:
+            return matches[0]
+        return sorted(slot for slots in matches for slot in slots)
+
+    def _get_matching_slots(
+        self, identifier: ItemIdentifier
+    ) -> tuple[list[Item | None], list[int]]:
+        """Get the indexed items list and the ascending slots matching the ID or name."""
+        items, id_index, name_index = self._get_index()
+        if isinstance(identifier, int):
+            return items, self._slots_by_id(id_index, identifier)
+        return items, self._slots_by_name(name_index, identifier)
+
     def get_total_count(self) -> int:
         """Get count of non-empty slots."""
-        return sum(1 for item in self.items if item is not None)
+        self._get_index()
+        return self._non_empty_count
 
     def get_total_quantity(self) -> int:
         """Get total quantity of all items (sum of stacks)."""
-        return sum(item.quantity for item in self.items if item is not None)
+        self._get_index()
+        return self._total_quantity
 
     def get_item_count(self, identifier: ItemIdentifier) -> int:
         """Get count of items matching the given ID or name."""
-        if isinstance(identifier, int):
-            return sum(1 for item in self.items if item is not None and item.id == identifier)
-        return sum(1 for item in self.items if item is not None and identifier in item.name)
+        return len(self._get_matching_slots(identifier)[1])
 
     def get_items(self, identifier: ItemIdentifier) -> list[Item]:
         """Get all items matching the given ID or name."""
-        if isinstance(identifier, int):
-            return [item for item in self.items if item is not None and item.id == identifier]
-        return [item for item in self.items if item is not None and identifier in item.name]
+        items, slots = self._get_matching_slots(identifier)
+        # Indexed slots are never empty; the filter only narrows the type
+        return [item for slot in slots if (item := items[slot]) is not None]
 
     def get_slot(self, slot_index: int) -> Item | None:
         """Get item at specific slot index."""
@@ -88,34 +143,19 @@ class ItemContainer:
 
     def find_item_slot(self, identifier: ItemIdentifier) -> int | None:
         """Find the first slot index containing an item matching the ID or name."""
-        if isinstance(identifier, int):
-            for index, item in enumerate(self.items):
-                if item is not None and item.id == identifier:
-                    return index
-        else:
-            for index, item in enumerate(self.items):
-                if item is not None and identifier in item.name:
-                    return index
-        return None
+        slots = self._get_matching_slots(identifier)[1]
+        return slots[0] if slots else None
 
     def find_item_slots(self, identifier: ItemIdentifier) -> list[int]:
         """Find all slot indices containing items matching the ID or name."""
-        slots = []
-        if isinstance(identifier, int):
-            for index, item in enumerate(self.items):
-                if item is not None and item.id == identifier:
-                    slots.append(index)
-        else:
-            for index, item in enumerate(self.items):
-                if item is not None and identifier in item.name:
-                    slots.append(index)
-        return slots
+        return list(self._get_matching_slots(identifier)[1])
 
     def contains_item(self, identifier: ItemIdentifier) -> bool:
         """Check if container contains an item matching the ID or name."""
+        _, id_index, name_index = self._get_index()
         if isinstance(identifier, int):
-            return any(item is not None and item.id == identifier for item in self.items)
-        return any(item is not None and identifier in item.name for item in self.items)
+            return identifier in id_index
+        return any(identifier in name for name in name_index)
 
     def contains_all_items(self, identifiers: list[ItemIdentifier]) -> bool:
         """Check if container contains all items matching the given IDs or names."""
@@ -123,23 +163,17 @@ class ItemContainer:
 
     def get_item_quantity(self, identifier: ItemIdentifier) -> int:
         """Get total quantity of items matching the given ID or name."""
-        if isinstance(identifier, int):
-            return sum(
-                item.quantity for item in self.items if item is not None and item.id == identifier
-            )
-        return sum(
-            item.quantity for item in self.items if item is not None and identifier in item.name
-        )
+        return sum(item.quantity for item in self.get_items(identifier))
 
     def is_empty(self) -> bool:
         """Check if container has no items."""
-        return all(item is None for item in self.items)
+        return self.get_total_count() == 0
 
     def is_full(self) -> bool:
         """Check if container is full."""
         if self.slot_count > 0:
             return self.get_total_count() >= self.slot_count
-        return all(item is not None for item in self.items)
+        return self.get_total_count() == len(self.items)
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -1,5 +1,9 @@
 """PackedPosition type for efficient OSRS coordinate storage."""
 
+import functools
+
+import numpy as np
+
 
 class PackedPosition:
     """Efficient packed position representation for OSRS coordinates."""
@@ -17,7 +21,10 @@ class PackedPosition:
 
         self._packed = (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30)
 
+    # Positions are never mutated, so repeat decodes (paths, ground item tiles) share one
+    # instance per packed int
     @classmethod
+    @functools.lru_cache(maxsize=8192)
     def from_packed(cls, packed: int) -> "PackedPosition":
         """Create from a packed integer."""
         pos = cls.__new__(cls)
@@ -101,3 +108,14 @@ def unpack_position(packed: int) -> tuple[int, int, int]:
     plane = (packed >> 30) & 0x3  # 2 bits (30-31)
 
     return (x, y, plane)
+
+
+def unpack_positions(packed: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unpack an array of packed (signed or unsigned) positions into x, y, plane arrays."""
+    packed = np.asarray(packed, dtype=np.int64) & 0xFFFFFFFF
+
+    x = packed & 0x7FFF
+    y = (packed >> 15) & 0x7FFF
+    plane = (packed >> 30) & 0x3
+
+    return x, y, plane
@@ -4,6 +4,7 @@ Path and obstacle types for navigation.
 Uses numpy arrays for efficient coordinate storage and projection integration.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     from escape.world.projection import TileGrid
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathObstacle:
     """Represents an obstacle along a path with origin, destination, and timing."""
 
@@ -47,18 +48,42 @@ class PathObstacle:
 class Path:
     """Navigation path with numpy-backed coordinate storage for efficient vectorized operations."""
 
-    __slots__ = ("_obstacles", "_packed")
+    __slots__ = (
+        "_first_obstacle_idx",
+        "_index_of",
+        "_obstacle_at",
+        "_obstacle_origins",
+        "_obstacles",
+        "_packed",
+        "_plane",
+        "_world_x",
+        "_world_y",
+    )
 
     def __init__(self, packed: np.ndarray, obstacles: list[PathObstacle]):
         """Initialize path with packed positions and obstacles."""
-        self._packed = packed.astype(np.int32)
+        # No copy when the caller already holds a contiguous int32 array
+        self._packed = np.ascontiguousarray(packed, dtype=np.int32)
         self._obstacles = obstacles
+        self._first_obstacle_idx: int | None = None
+        # Unpacked coordinate arrays, computed on first access (packed tiles never change)
+        self._world_x: np.ndarray | None = None
+        self._world_y: np.ndarray | None = None
+        self._plane: np.ndarray | None = None
+        # packed -> first tile index and origin packed -> first obstacle, built on first lookup
+        self._index_of: dict[int, int] | None = None
+        self._obstacle_at: dict[int, PathObstacle] | None = None
+        self._obstacle_origins: np.ndarray | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Path":
         """Create Path from Java response dict."""
-        # Direct numpy conversion - instant for any size
-        packed = np.array(data["path"], dtype=np.int32)
+        # Adopt packed buffers and arrays without copying; lists still need converting
+        path = data["path"]
+        if isinstance(path, bytes | bytearray | memoryview):
+            packed = np.frombuffer(path, dtype=np.int32)
+        else:
+            packed = np.asarray(path, dtype=np.int32)
 
         # Obstacles are few, so list comprehension is fine
         obstacles = [PathObstacle.from_dict(obs) for obs in data.get("obstacles", [])]
@@ -67,18 +92,27 @@ class Path:
 
     @property
     def world_x(self) -> np.ndarray:
-        """World X coordinates (vectorized). Shape: [length]. X is bits 0-14."""
-        return (self._packed & 0x7FFF).astype(np.int32)
+        """World X coordinates (vectorized, read-only). Shape: [length]. X is bits 0-14."""
+        if self._world_x is None:
+            self._world_x = self._packed & 0x7FFF
+            self._world_x.flags.writeable = False
+        return self._world_x
 
     @property
     def world_y(self) -> np.ndarray:
-        """World Y coordinates (vectorized). Shape: [length]. Y is bits 15-29."""
-        return ((self._packed >> 15) & 0x7FFF).astype(np.int32)
+        """World Y coordinates (vectorized, read-only). Shape: [length]. Y is bits 15-29."""
+        if self._world_y is None:
+            self._world_y = (self._packed >> 15) & 0x7FFF
+            self._world_y.flags.writeable = False
+        return self._world_y
 
     @property
     def plane(self) -> np.ndarray:
-        """Plane values (vectorized). Shape: [length]."""
-        return ((self._packed >> 30) & 0x3).astype(np.int32)
+        """Plane values (vectorized, read-only). Shape: [length]."""
+        if self._plane is None:
+            self._plane = (self._packed >> 30) & 0x3
+            self._plane.flags.writeable = False
+        return self._plane
 
     @property
     def packed(self) -> np.ndarray:
@@ -101,9 +135,8 @@ class Path:
         scene_x = self.world_x - grid.base_x
         scene_y = self.world_y - grid.base_y
 
-        in_scene = (
-            (scene_x >= 0) & (scene_x < grid.size_x) & (scene_y >= 0) & (scene_y < grid.size_y)
-        )
+        # Negative offsets wrap to huge unsigned values, so one compare per axis bounds-checks
+        in_scene = (scene_x.view(np.uint32) < grid.size_x) & (scene_y.view(np.uint32) < grid.size_y)
 
         return scene_x, scene_y, in_scene
 
@@ -116,44 +149,31 @@ class Path:
 
         scene_x, scene_y, in_scene = self.get_scene_coords()
 
-        # Initialize output arrays
+        # Out-of-scene tiles stay at (0, 0) and not visible
         n = len(self._packed)
         screen_x = np.zeros(n, dtype=np.int32)
         screen_y = np.zeros(n, dtype=np.int32)
         visible = np.zeros(n, dtype=np.bool_)
 
-        if not in_scene.any():
+        rows = np.flatnonzero(in_scene)
+        if rows.size == 0:
             return screen_x, screen_y, visible
 
-        # Get tile indices for in-scene tiles (clip to valid range)
-        clipped_x = scene_x.clip(0, grid.size_x - 1)
-        clipped_y = scene_y.clip(0, grid.size_y - 1)
-        tile_idx = clipped_x * grid.size_y + clipped_y
-
-        # Get centers from grid cache
-        center_x, center_y = grid.get_tile_centers()
-        screen_x = center_x[tile_idx]
-        screen_y = center_y[tile_idx]
-
-        # Visibility: in scene + valid tile + on screen
-        tile_valid = grid.tile_valid[tile_idx]
-
-        if margin == 0:
-            on_screen = (
-                (screen_x >= grid.view_min_x)
-                & (screen_x < grid.view_max_x)
-                & (screen_y >= grid.view_min_y)
-                & (screen_y < grid.view_max_y)
-            )
-        else:
-            on_screen = (
-                (screen_x >= grid.view_min_x - margin)
-                & (screen_x < grid.view_max_x + margin)
-                & (screen_y >= grid.view_min_y - margin)
-                & (screen_y < grid.view_max_y + margin)
-            )
-
-        visible = in_scene & tile_valid & on_screen
+        # Average only the path tiles' corners rather than every tile centre in the scene
+        tile_idx = scene_x[rows] * grid.size_y + scene_y[rows]
+        corner_x, corner_y = grid.get_tile_corner_arrays(tile_idx)
+        center_x = corner_x.sum(axis=1) >> 2
+        center_y = corner_y.sum(axis=1) >> 2
+        screen_x[rows] = center_x
+        screen_y[rows] = center_y
+
+        visible[rows] = (
+            grid.tile_valid[tile_idx]
+            & (center_x >= grid.view_min_x - margin)
+            & (center_x < grid.view_max_x + margin)
+            & (center_y >= grid.view_min_y - margin)
+            & (center_y < grid.view_max_y + margin)
+        )
 
         return screen_x, screen_y, visible
 
@@ -169,16 +189,8 @@ class Path:
             return []
 
         scene_x, scene_y, in_scene = self.get_scene_coords()
-        indices = np.where(in_scene)[0]
-
-        quads = []
-        for i in indices:
-            sx, sy = scene_x[i], scene_y[i]
-            tile_idx = int(sx * grid.size_y + sy)
-            if grid.tile_on_screen[tile_idx]:
-                quads.append(grid.get_tile_quad(tile_idx))
-
-        return quads
+        tile_idx = scene_x[in_scene] * grid.size_y + scene_y[in_scene]
+        return grid.get_tile_quads(tile_idx[grid.tile_on_screen[tile_idx]])
 
     def get_screen_point(self, i: int) -> "Point | None":
         """Get screen Point for path tile at index, or None if not in scene."""
@@ -216,6 +228,24 @@ class Path:
         tile_idx = scene_x * grid.size_y + scene_y
         return grid.get_tile_quad(tile_idx)
 
+    def get_quad_corners(
+        self, indices: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get quad corners for path tiles as [n, 4] (x, y) arrays plus an in-scene mask."""
+        grid = self._get_tile_grid()
+        if grid is None:
+            empty = np.empty((0, 4), dtype=np.int32)
+            return empty, empty, np.array([], dtype=np.bool_)
+
+        scene_x, scene_y, in_scene = self.get_scene_coords()
+        if indices is not None:
+            scene_x, scene_y, in_scene = scene_x[indices], scene_y[indices], in_scene[indices]
+
+        # Out-of-scene rows get clipped placeholder corners; callers mask them with in_scene
+        tile_idx = scene_x.clip(0, grid.size_x - 1) * grid.size_y + scene_y.clip(0, grid.size_y - 1)
+        corner_x, corner_y = grid.get_tile_corner_arrays(tile_idx)
+        return corner_x, corner_y, in_scene
+
     @property
     def obstacles(self) -> list[PathObstacle]:
         """Get all obstacles in path."""
@@ -233,7 +263,7 @@ class Path:
         """Get PackedPosition at index, or None if out of bounds."""
         if i < 0 or i >= len(self._packed):
             return None
-        return PackedPosition.from_packed(int(self._packed[i]))
+        return PackedPosition.from_packed(self._packed.item(i))
 
     def get_start(self) -> PackedPosition | None:
         """Get start position."""
@@ -245,26 +275,52 @@ class Path:
 
     def get_next_tile(self, current: PackedPosition) -> PackedPosition | None:
         """Get next tile from current position, or None if at end."""
-        # Vectorized search
-        matches = np.where(self._packed == current.packed)[0]
-        if len(matches) == 0:
+        if self._index_of is None:
+            index_of: dict[int, int] = {}
+            for i, packed in enumerate(self._packed.tolist()):
+                index_of.setdefault(packed, i)
+            self._index_of = index_of
+
+        idx = self._index_of.get(current.packed)
+        if idx is None or idx >= len(self._packed) - 1:
             return None
-        idx = matches[0]
-        if idx < len(self._packed) - 1:
-            return PackedPosition.from_packed(int(self._packed[idx + 1]))
-        return None
+        return PackedPosition.from_packed(self._packed.item(idx + 1))
 
     def get_obstacle_at(self, position: PackedPosition) -> PathObstacle | None:
         """Get obstacle at position, or None if no obstacle."""
-        for obstacle in self._obstacles:
-            if obstacle.origin == position:
-                return obstacle
-        return None
+        if self._obstacle_at is None:
+            obstacle_at: dict[int, PathObstacle] = {}
+            for obstacle in self._obstacles:
+                obstacle_at.setdefault(obstacle.origin.packed, obstacle)
+            self._obstacle_at = obstacle_at
+
+        return self._obstacle_at.get(position.packed)
 
     def has_obstacles(self) -> bool:
         """Check if path has any obstacles."""
         return len(self._obstacles) > 0
 
+    def _get_obstacle_origins(self) -> np.ndarray:
+        """Get the packed origin of each obstacle, in obstacle order."""
+        if self._obstacle_origins is None:
+            self._obstacle_origins = np.fromiter(
+                (obstacle.origin.packed for obstacle in self._obstacles),
+                dtype=np.int64,
+                count=len(self._obstacles),
+            )
+        return self._obstacle_origins
+
+    def get_first_obstacle_index(self) -> int:
+        """Get index of the first tile that is an obstacle origin, or length() if none."""
+        if self._first_obstacle_idx is None:
+            # Packed tiles and obstacles never change after construction, so compute once
+            self._first_obstacle_idx = len(self._packed)
+            if self._obstacles:
+                is_origin = np.isin(self._packed, self._get_obstacle_origins())
+                if is_origin.any():
+                    self._first_obstacle_idx = int(is_origin.argmax())
+        return self._first_obstacle_idx
+
     def get_total_duration(self) -> int:
         """Get total estimated duration in ticks (walking + obstacles)."""
         # Approximate: 1 tile = 1 tick walking
@@ -278,9 +334,12 @@ class Path:
 
     def distance_to_tile(self, world_x: int, world_y: int) -> np.ndarray:
         """Calculate Chebyshev distance from each path tile to a point."""
-        dx = np.abs(self.world_x - world_x)
-        dy = np.abs(self.world_y - world_y)
-        return np.maximum(dx, dy)
+        # Two temporaries, reused in place for abs and max
+        dx = self.world_x - world_x
+        dy = self.world_y - world_y
+        np.abs(dx, out=dx)
+        np.abs(dy, out=dy)
+        return np.maximum(dx, dy, out=dx)
 
     def find_closest_tile(self, world_x: int, world_y: int) -> int:
         """Find index of path tile closest to a point, or -1 if empty."""
@@ -296,8 +355,8 @@ class Path:
         new_packed = self._packed[start_idx:]
 
         # Filter obstacles that are still ahead
-        remaining_positions = set(new_packed.tolist())
-        new_obstacles = [obs for obs in self._obstacles if obs.origin.packed in remaining_positions]
+        ahead = np.isin(self._get_obstacle_origins(), new_packed).tolist()
+        new_obstacles = [obs for obs, keep in zip(self._obstacles, ahead, strict=True) if keep]
 
         return Path(new_packed, new_obstacles)
 
@@ -305,14 +364,22 @@ class Path:
         """Support len() builtin."""
         return len(self._packed)
 
+    def iter_packed(self) -> Iterator[int]:
+        """Iterate over raw packed integers without creating PackedPositions."""
+        return iter(self._packed.tolist())
+
+    def iter_xy(self) -> Iterator[tuple[int, int]]:
+        """Iterate over (world_x, world_y) tuples without creating PackedPositions."""
+        return zip(self.world_x.tolist(), self.world_y.tolist(), strict=True)
+
     def __iter__(self):
         """Iterate over PackedPosition objects (creates on-demand)."""
-        for p in self._packed:
-            yield PackedPosition.from_packed(int(p))
+        for p in self._packed.tolist():
+            yield PackedPosition.from_packed(p)
 
     def __getitem__(self, index) -> PackedPosition:
         """Support indexing (creates PackedPosition on-demand)."""
-        return PackedPosition.from_packed(int(self._packed[index]))
+        return PackedPosition.from_packed(self._packed.item(index))
 
     def __repr__(self) -> str:
         return (
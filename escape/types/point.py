@@ -4,7 +4,7 @@ import math
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Point:
     """Represents a 2D point with integer coordinates."""
 
@@ -13,9 +13,13 @@ class Point:
 
     def distance_to(self, other: "Point") -> float:
         """Calculate Euclidean distance to another point."""
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_to_sq(self, other: "Point") -> int:
+        """Calculate squared Euclidean distance to another point (for comparisons)."""
         dx = self.x - other.x
         dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
 
     def click(self, button: str = "left") -> None:
         """Click at this point."""
@@ -55,7 +59,7 @@ class Point:
         drawing.add_line(self.x, self.y - size, self.x, self.y + size, argb_color, thickness, tag)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Point3D:
     """Represents a 3D point with integer coordinates."""
 
@@ -65,10 +69,14 @@ class Point3D:
 
     def distance_to(self, other: "Point3D") -> float:
         """Calculate 3D Euclidean distance to another point."""
+        return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def distance_to_sq(self, other: "Point3D") -> int:
+        """Calculate squared 3D Euclidean distance to another point (for comparisons)."""
         dx = self.x - other.x
         dy = self.y - other.y
         dz = self.z - other.z
-        return math.sqrt(dx * dx + dy * dy + dz * dz)
+        return dx * dx + dy * dy + dz * dz
 
     def to2d(self) -> Point:
         """Convert to 2D point, dropping z coordinate."""
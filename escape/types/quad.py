@@ -1,15 +1,17 @@
 """Quad (quadrilateral) geometry type - optimized for 4-vertex shapes like tiles."""
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from escape.types.point import Point
     from escape.types.polygon import Polygon
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Quad:
     """Represents a quadrilateral defined by exactly 4 vertices in order."""
 
@@ -17,6 +19,43 @@ class Quad:
     p2: "Point"
     p3: "Point"
     p4: "Point"
+    # Derived geometry, computed once at construction since the vertices are fixed
+    _xs: tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    _ys: tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    _bounds: tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    _area: float = field(init=False, repr=False, compare=False)
+    # Convex allowing repeated/collinear vertices (is_convex) vs. all four turns the
+    # same strict direction (gates the four-edge contains test)
+    _convex_nonstrict: bool = field(init=False, repr=False, compare=False)
+    _strictly_convex: bool = field(init=False, repr=False, compare=False)
+    # Built on first center() call; most tile quads are never asked for it
+    _center: "Point | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        xs = (self.p1.x, self.p2.x, self.p3.x, self.p4.x)
+        ys = (self.p1.y, self.p2.y, self.p3.y, self.p4.y)
+        # Turn direction at each vertex; zero for repeated or collinear vertices
+        has_pos = has_neg = has_zero = False
+        for i in range(4):
+            j, k = (i + 1) % 4, (i + 2) % 4
+            cross = (xs[j] - xs[i]) * (ys[k] - ys[i]) - (ys[j] - ys[i]) * (xs[k] - xs[i])
+            if cross > 0:
+                has_pos = True
+            elif cross < 0:
+                has_neg = True
+            else:
+                has_zero = True
+        # Shoelace formula
+        twice_area = sum(xs[i] * ys[(i + 1) % 4] - xs[(i + 1) % 4] * ys[i] for i in range(4))
+
+        set_field = object.__setattr__
+        set_field(self, "_xs", xs)
+        set_field(self, "_ys", ys)
+        set_field(self, "_bounds", (min(xs), min(ys), max(xs), max(ys)))
+        set_field(self, "_area", abs(twice_area) / 2.0)
+        set_field(self, "_convex_nonstrict", not (has_pos and has_neg))
+        # Quads with repeated or collinear vertices keep the triangle test
+        set_field(self, "_strictly_convex", not (has_pos and has_neg) and not has_zero)
 
     @classmethod
     def from_points(cls, points: list["Point"]) -> "Quad":
@@ -32,8 +71,8 @@ class Quad:
 
         if len(coords) != 4:
             raise ValueError(f"Quad requires exactly 4 coordinates, got {len(coords)}")
-        points = [Point(x, y) for x, y in coords]
-        return cls(points[0], points[1], points[2], points[3])
+        a, b, c, d = coords
+        return cls(Point(a[0], a[1]), Point(b[0], b[1]), Point(c[0], c[1]), Point(d[0], d[1]))
 
     @classmethod
     def from_arrays(cls, x_coords: list[int], y_coords: list[int]) -> "Quad":
@@ -49,6 +88,18 @@ class Quad:
             Point(x_coords[3], y_coords[3]),
         )
 
+    @classmethod
+    def from_arrays_batch(cls, x_coords: np.ndarray, y_coords: np.ndarray) -> list["Quad"]:
+        """Create one Quad per row of [n, 4] x and y coordinate arrays."""
+        from escape.types.point import Point
+
+        return [
+            cls(Point(x1, y1), Point(x2, y2), Point(x3, y3), Point(x4, y4))
+            for (x1, x2, x3, x4), (y1, y2, y3, y4) in zip(
+                x_coords.tolist(), y_coords.tolist(), strict=True
+            )
+        ]
+
     @property
     def vertices(self) -> list["Point"]:
         """Get all 4 vertices as a list."""
@@ -56,19 +107,19 @@ class Quad:
 
     def center(self) -> "Point":
         """Get the centroid (center of mass) of the quad."""
-        from escape.types.point import Point
+        center = self._center
+        if center is None:
+            from escape.types.point import Point
 
-        x = (self.p1.x + self.p2.x + self.p3.x + self.p4.x) // 4
-        y = (self.p1.y + self.p2.y + self.p3.y + self.p4.y) // 4
-        return Point(x, y)
+            center = Point(sum(self._xs) // 4, sum(self._ys) // 4)
+            object.__setattr__(self, "_center", center)
+        return center
 
     def bounds(self) -> tuple[int, int, int, int]:
         """Get the axis-aligned bounding box of this quad."""
-        xs = [self.p1.x, self.p2.x, self.p3.x, self.p4.x]
-        ys = [self.p1.y, self.p2.y, self.p3.y, self.p4.y]
-        return (min(xs), min(ys), max(xs), max(ys))
+        return self._bounds
 
-    def _sign(self, p1x: int, p1y: int, p2x: int, p2y: int, p3x: int, p3y: int) -> float:
+    def _sign(self, p1x: int, p1y: int, p2x: int, p2y: int, p3x: int, p3y: int) -> int:
         """Calculate cross product sign for point-in-triangle test."""
         return (p1x - p3x) * (p2y - p3y) - (p2x - p3x) * (p1y - p3y)
 
@@ -78,32 +129,54 @@ class Quad:
         d2 = self._sign(px, py, v2.x, v2.y, v3.x, v3.y)
         d3 = self._sign(px, py, v3.x, v3.y, v1.x, v1.y)
 
-        has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-        has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
+        has_neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+        has_pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
 
         return not (has_neg and has_pos)
 
     def contains(self, point: "Point") -> bool:
-        """Check if a point is within this quad using triangle decomposition."""
+        """Check if a point is within this quad."""
         px, py = point.x, point.y
 
+        if self._strictly_convex:
+            # Convex: inside iff the point is on the same side of all four edges
+            p1, p2, p3, p4 = self.p1, self.p2, self.p3, self.p4
+            d1 = (p2.x - p1.x) * (py - p1.y) - (p2.y - p1.y) * (px - p1.x)
+            d2 = (p3.x - p2.x) * (py - p2.y) - (p3.y - p2.y) * (px - p2.x)
+            d3 = (p4.x - p3.x) * (py - p3.y) - (p4.y - p3.y) * (px - p3.x)
+            d4 = (p1.x - p4.x) * (py - p4.y) - (p1.y - p4.y) * (px - p4.x)
+            has_neg = (d1 < 0) | (d2 < 0) | (d3 < 0) | (d4 < 0)
+            has_pos = (d1 > 0) | (d2 > 0) | (d3 > 0) | (d4 > 0)
+            return not (has_neg and has_pos)
+
         # Split quad into two triangles: (p1, p2, p3) and (p1, p3, p4)
         # Point is in quad if it's in either triangle
         return self._point_in_triangle(
             px, py, self.p1, self.p2, self.p3
         ) or self._point_in_triangle(px, py, self.p1, self.p3, self.p4)
 
+    def _triangle_mask(
+        self, xs: np.ndarray, ys: np.ndarray, v1: "Point", v2: "Point", v3: "Point"
+    ) -> np.ndarray:
+        """Check many points against one triangle. Returns a boolean mask."""
+        d1 = (xs - v2.x) * (v1.y - v2.y) - (v1.x - v2.x) * (ys - v2.y)
+        d2 = (xs - v3.x) * (v2.y - v3.y) - (v2.x - v3.x) * (ys - v3.y)
+        d3 = (xs - v1.x) * (v3.y - v1.y) - (v3.x - v1.x) * (ys - v1.y)
+        has_neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+        has_pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
+        return ~(has_neg & has_pos)
+
+    def contains_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Check many points at once. Returns a boolean mask."""
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        return self._triangle_mask(xs, ys, self.p1, self.p2, self.p3) | self._triangle_mask(
+            xs, ys, self.p1, self.p3, self.p4
+        )
+
     def area(self) -> float:
         """Calculate the area of the quad using the shoelace formula."""
-        # Shoelace formula for quad
-        area = 0.0
-        vertices = self.vertices
-        n = 4
-        for i in range(n):
-            j = (i + 1) % n
-            area += vertices[i].x * vertices[j].y
-            area -= vertices[j].x * vertices[i].y
-        return abs(area) / 2.0
+        return self._area
 
     def random_point(self) -> "Point":
         """Generate a random point within this quad using bilinear interpolation."""
@@ -136,14 +209,18 @@ class Quad:
         if self.contains(point):
             return point
 
-        # For concave quads, use rejection sampling as fallback
+        # For concave quads, rejection-sample up to 100 candidates in chunks of 10,
+        # stopping at the first chunk with a hit. Drawn from the same `random`
+        # stream as above so seeding stays reproducible.
         min_x, min_y, max_x, max_y = self.bounds()
-        for _ in range(100):
-            x = random.randint(min_x, max_x)
-            y = random.randint(min_y, max_y)
-            point = Point(x, y)
-            if self.contains(point):
-                return point
+        randint = random.randint
+        for _ in range(10):
+            xs = np.array([randint(min_x, max_x) for _ in range(10)])
+            ys = np.array([randint(min_y, max_y) for _ in range(10)])
+            inside = self.contains_batch(xs, ys)
+            if inside.any():
+                k = int(inside.argmax())
+                return Point(int(xs[k]), int(ys[k]))
 
         # Ultimate fallback to center
         return self.center()
@@ -177,22 +254,7 @@ class Quad:
 
     def is_convex(self) -> bool:
         """Check if this quad is convex."""
-        vertices = self.vertices
-
-        def cross_product(o: "Point", a: "Point", b: "Point") -> float:
-            return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
-
-        signs = []
-        for i in range(4):
-            o = vertices[i]
-            a = vertices[(i + 1) % 4]
-            b = vertices[(i + 2) % 4]
-            cross = cross_product(o, a, b)
-            if cross != 0:
-                signs.append(cross > 0)
-
-        # Convex if all signs are the same
-        return len(set(signs)) <= 1
+        return self._convex_nonstrict
 
     def __repr__(self) -> str:
         return f"Quad({self.p1}, {self.p2}, {self.p3}, {self.p4})"
@@ -203,6 +265,4 @@ class Quad:
         """Draw this quad as an overlay on RuneLite."""
         from escape.input.drawing import drawing
 
-        x_points = [self.p1.x, self.p2.x, self.p3.x, self.p4.x]
-        y_points = [self.p1.y, self.p2.y, self.p3.y, self.p4.y]
-        drawing.add_polygon(x_points, y_points, argb_color, filled, tag)
+        drawing.add_polygon(list(self._xs), list(self._ys), argb_color, filled, tag)
@@ -1,6 +1,11 @@
+import contextlib
+import types
 import typing
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 from typing import ClassVar, Literal
 
+from escape._internal import input_generation
 from escape.globals import get_client
 
 WidgetField = Literal[
@@ -144,12 +149,32 @@ class _WidgetFields:
 # Module-level instance for IDE autocomplete
 WidgetFields = _WidgetFields()
 
+# Queries cached per tick; UI polling repeats a small set, so this only guards against leaks
+_TICK_CACHE_MAX = 2048
+
+
+def _copy_result(result: typing.Any) -> typing.Any:
+    """Copy a cached property dict or children list so callers can't mutate the cached one."""
+    if isinstance(result, dict):
+        return dict(result)
+    if isinstance(result, list):
+        return [dict(item) if isinstance(item, dict) else item for item in result]
+    return result
+
 
 class Widget:
     """Python-side mask builder for widget property queries."""
 
+    __slots__ = ("_mask", "id")
+
     _FIELDS: ClassVar[list[WidgetField]] = list(typing.get_args(WidgetField))  # keeps exact order
     _FIELD_BITS: ClassVar[dict[str, int]] = {name: 1 << i for i, name in enumerate(_FIELDS)}
+    # Fields that must be read on the client thread (sync invoke)
+    _PARENT_MASK: ClassVar[int] = _FIELD_BITS["getParent"] | _FIELD_BITS["getParentId"]
+    # Single-widget query results keyed by (method, id, mask, extra), valid for one
+    # (game tick, input generation): input can change the UI client-side mid-tick
+    _tick_cache: ClassVar[dict[tuple, typing.Any]] = {}
+    _tick_cache_stamp: ClassVar[tuple[int, int] | None] = None
 
     def __init__(self, id):
         self._mask = 0
@@ -165,6 +190,20 @@ class Widget:
         self._mask |= self._FIELD_BITS[field]
         return self
 
+    def enable_bit(self, bits: int) -> "Widget":
+        """Enable precomputed field bits, e.g. WidgetBits.get_text | WidgetBits.get_name."""
+        self._mask |= bits
+        return self
+
+    def enable_many(self, fields: Iterable[WidgetField]) -> "Widget":
+        """Enable several getter flags in one update."""
+        field_bits = self._FIELD_BITS
+        bits = 0
+        for field in fields:
+            bits |= field_bits[field]
+        self._mask |= bits
+        return self
+
     def disable(self, field: WidgetField) -> "Widget":
         """Disable a specific getter flag."""
         self._mask &= ~self._FIELD_BITS[field]
@@ -183,9 +222,13 @@ class Widget:
     @classmethod
     def from_names(cls, widget_id: int, *fields: WidgetField) -> "Widget":
         """Build a mask in one line."""
+        return cls(widget_id).enable_many(fields)
+
+    @classmethod
+    def from_bits(cls, widget_id: int, mask: int) -> "Widget":
+        """Build from a precomputed mask, e.g. WidgetBits.get_text | WidgetBits.get_name."""
         w = cls(widget_id)
-        for f in fields:
-            w.enable(f)
+        w._mask = mask
         return w
 
     def as_dict(self) -> dict[str, bool]:
@@ -193,57 +236,92 @@ class Widget:
         return {name: bool(self._mask & bit) for name, bit in self._FIELD_BITS.items()}
 
     def get(self) -> dict[str, typing.Any]:
-        client = get_client()
-        result = client.api.invoke_custom_method(
-            target="WidgetInspector",
-            method="getWidgetProperties",
-            signature="(IJ)[B",
-            args=[self.id, self.mask],
-            async_exec=self.get_async_mode(),
-        )
+        """Get the masked properties."""
+        if not self._mask:
+            return {}
 
-        return result
+        return self._invoke_cached("getWidgetProperties", "(IJ)[B", [self.id, self._mask])
 
     def get_child(self, child_index: int) -> dict[str, typing.Any]:
-        client = get_client()
-        result = client.api.invoke_custom_method(
-            target="WidgetInspector",
-            method="getWidgetChild",
-            signature="(IIJ)[B",
-            args=[self.id, child_index, self.mask],
-            async_exec=self.get_async_mode(),
+        if not self._mask:
+            return {}
+        return self._invoke_cached(
+            "getWidgetChild", "(IIJ)[B", [self.id, child_index, self._mask], child_index
         )
 
-        return result
-
     def get_children(self) -> list[dict[str, typing.Any]]:
-        client = get_client()
-        result = client.api.invoke_custom_method(
-            target="WidgetInspector",
-            method="getWidgetChildren",
-            signature="(IJ)[B",
-            args=[self.id, self.mask],
-            async_exec=self.get_async_mode(),
-        )
-
-        return result
+        return self._invoke_cached("getWidgetChildren", "(IJ)[B", [self.id, self._mask])
 
     def get_children_masked(self, childmask: list[int]) -> list[dict[str, typing.Any]]:
+        return self._invoke_cached(
+            "getWidgetChildrenMasked",
+            "(I[IJ)[B",
+            [self.id, childmask, self._mask],
+            tuple(childmask),
+        )
+
+    def _invoke_cached(
+        self, method: str, signature: str, args: list[typing.Any], extra: typing.Any = None
+    ) -> typing.Any:
+        """Invoke a WidgetInspector query, reusing an identical query's result from this tick."""
         client = get_client()
+        tick = client.cache.tick
+        key = (method, self.id, self._mask, extra)
+        if tick is not None:
+            stamp = (tick, input_generation.get())
+            if stamp != Widget._tick_cache_stamp:
+                Widget._tick_cache = {}
+                Widget._tick_cache_stamp = stamp
+            else:
+                cached = Widget._tick_cache.get(key)
+                if cached is not None:
+                    return _copy_result(cached)
+
         result = client.api.invoke_custom_method(
             target="WidgetInspector",
-            method="getWidgetChildrenMasked",
-            signature="(I[IJ)[B",
-            args=[self.id, childmask, self.mask],
+            method=method,
+            signature=signature,
+            args=args,
             async_exec=self.get_async_mode(),
         )
 
+        if tick is not None and result is not None and len(Widget._tick_cache) < _TICK_CACHE_MAX:
+            Widget._tick_cache[key] = _copy_result(result)
         return result
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached query results, e.g. after a UI change not caused by SDK input."""
+        Widget._tick_cache = {}
+
     def get_async_mode(self) -> bool:
         """Return False if mask includes getParent/getParentId (requires sync)."""
-        parent_fields = self._FIELD_BITS["getParent"] | self._FIELD_BITS["getParentId"]
-        return (self._mask & parent_fields) == 0
+        return not self._mask & Widget._PARENT_MASK
+
+    @staticmethod
+    @contextlib.contextmanager
+    def batched() -> Iterator["WidgetBatch"]:
+        """Collect batch.add(widget) requests in the block and send them as one batch on exit."""
+        batch = WidgetBatch()
+        try:
+            yield batch
+        except BaseException:
+            batch._cancel()
+            raise
+        batch._flush()
+
+    @staticmethod
+    def _split_batch(widgets: list["Widget"]) -> tuple[list[int], list[int], int]:
+        """Get (ids, masks, OR of all masks) in one pass over widgets."""
+        ids = []
+        masks = []
+        any_mask = 0
+        for w in widgets:
+            mask = w._mask
+            ids.append(w.id)
+            masks.append(mask)
+            any_mask |= mask
+        return ids, masks, any_mask
 
     @staticmethod
     def get_batch(widgets: list["Widget"]) -> list[dict[str, typing.Any]]:
@@ -251,12 +329,12 @@ class Widget:
         if not widgets:
             return []
 
-        ids = [w.id for w in widgets]
-        masks = [w.mask for w in widgets]
-
+        ids, masks, any_mask = Widget._split_batch(widgets)
+        if not any_mask:
+            # Nothing requested; skip the round-trip but keep results aligned
+            return [{} for _ in widgets]
         # Check if any widget has parent fields - if so, use sync mode
-        parent_fields = Widget._FIELD_BITS["getParent"] | Widget._FIELD_BITS["getParentId"]
-        async_safe = all((w.mask & parent_fields) == 0 for w in widgets)
+        async_safe = not any_mask & Widget._PARENT_MASK
 
         client = get_client()
         result = client.api.invoke_custom_method(
@@ -269,18 +347,34 @@ class Widget:
 
         return result if result else []
 
+    @staticmethod
+    def get_batch_ids(ids: list[int], mask: int) -> list[dict[str, typing.Any]]:
+        """Get the same masked properties for many widget IDs in a single batch request."""
+        if not ids:
+            return []
+        if not mask:
+            return [{} for _ in ids]
+
+        client = get_client()
+        result = client.api.invoke_custom_method(
+            target="WidgetInspector",
+            method="getWidgetPropertiesBatch",
+            signature="([I[J)[B",
+            args=[ids, [mask] * len(ids)],
+            async_exec=not mask & Widget._PARENT_MASK,
+        )
+
+        return result if result else []
+
     @staticmethod
     def get_batch_children(widgets: list["Widget"]) -> list[dict[str, typing.Any]]:
         """Get children properties for multiple widgets in a single batch request."""
         if not widgets:
             return []
 
-        ids = [w.id for w in widgets]
-        masks = [w.mask for w in widgets]
-
+        ids, masks, any_mask = Widget._split_batch(widgets)
         # Check if any widget has parent fields - if so, use sync mode
-        parent_fields = Widget._FIELD_BITS["getParent"] | Widget._FIELD_BITS["getParentId"]
-        async_safe = all((w.mask & parent_fields) == 0 for w in widgets)
+        async_safe = not any_mask & Widget._PARENT_MASK
 
         client = get_client()
         result = client.api.invoke_custom_method(
@@ -292,3 +386,52 @@ class Widget:
         )
 
         return result if result else []
+
+
+# Field bits under the same snake_case names as WidgetFields, for Widget.enable_bit
+WidgetBits = types.SimpleNamespace(
+    **{
+        attr: Widget._FIELD_BITS[field]
+        for attr, field in vars(_WidgetFields).items()
+        if not attr.startswith("_")
+    }
+)
+
+
+class WidgetBatch:
+    """Property requests collected by Widget.batched(), sent as one batch request on exit."""
+
+    __slots__ = ("_pending",)
+
+    def __init__(self):
+        self._pending: list[tuple[Widget, Future[dict[str, typing.Any]]]] = []
+
+    def add(self, widget: Widget) -> Future[dict[str, typing.Any]]:
+        """Queue the widget's masked properties; the Future resolves when the block exits."""
+        future: Future[dict[str, typing.Any]] = Future()
+        self._pending.append((widget, future))
+        return future
+
+    def _flush(self) -> None:
+        """Send the queued requests and resolve their futures."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            results = Widget.get_batch([widget for widget, _ in pending])
+            if len(results) != len(pending):
+                raise RuntimeError(
+                    f"Widget batch returned {len(results)} results for {len(pending)} widgets"
+                )
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            raise
+        for (_, future), result in zip(pending, results, strict=True):
+            future.set_result(result)
+
+    def _cancel(self) -> None:
+        """Cancel the queued requests without sending them."""
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            future.cancel()
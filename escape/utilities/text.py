@@ -1,10 +1,21 @@
 """Text manipulation utilities for RuneScape text."""
 
+import functools
 import re
 
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
 
 def strip_color_tags(text: str) -> str:
     """Remove RuneScape color and image tags from text."""
+    # Untagged text needs no regex and no cache entry
+    if "<" not in text:
+        return text
+    return _strip_tags_cached(text)
+
+
+# Menus repeat the same handful of tagged strings on every poll
+@functools.lru_cache(maxsize=512)
+def _strip_tags_cached(text: str) -> str:
     # Remove all tags in angle brackets (opening and closing)
-    text = re.sub(r"<[^>]+>", "", text)
-    return text
+    return _TAG_PATTERN.sub("", text)
@@ -1,6 +1,6 @@
 """OSRS ground item handling using event cache."""
 
-from typing import ClassVar, Self
+from typing import Any, ClassVar, Self
 
 from ..types.ground_item import GroundItem
 from ..types.ground_item_list import GroundItemList
@@ -13,12 +13,15 @@ class GroundItems:
     _instance: ClassVar[Self | None] = None
     _cached_list: GroundItemList
     _cached_tick: int
+    # packed coord -> (raw item dicts, their GroundItems) from the last refresh
+    _tiles: dict[int, tuple[list[dict[str, Any]], list[GroundItem]]]
 
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._cached_list = GroundItemList([])
             cls._instance._cached_tick = -1
+            cls._instance._tiles = {}
         return cls._instance
 
     def get_all_items(self) -> GroundItemList:
@@ -31,15 +34,33 @@ class GroundItems:
         if self._cached_tick == current_tick and self._cached_list.count() > 0:
             return self._cached_list
 
-        # Refresh cache
+        # Refresh cache. Snapshots are full, but most tiles are unchanged from the last one,
+        # so only tiles whose item data differs get new GroundItems
         ground_items_dict = client.cache.get_ground_items()
+        previous = self._tiles
+        tiles = {}
         result = []
 
+        # Hoisted lookups; this loop runs once per occupied tile
+        get_previous = previous.get
+        from_packed = PackedPosition.from_packed
+        extend = result.extend
+        item_cls = GroundItem
+
         for packed_coord, items_list in ground_items_dict.items():
-            position = PackedPosition.from_packed(packed_coord)
-            for item_data in items_list:
-                result.append(GroundItem(data=item_data, position=position, client=client))
+            cached = get_previous(packed_coord)
+            if cached is not None and cached[0] == items_list:
+                tile_items = cached[1]
+            else:
+                position = from_packed(packed_coord)
+                tile_items = [
+                    item_cls(data=item_data, position=position, client=client)
+                    for item_data in items_list
+                ]
+            tiles[packed_coord] = (items_list, tile_items)
+            extend(tile_items)
 
+        self._tiles = tiles
         self._cached_list = GroundItemList(result)
         if current_tick is not None:
             self._cached_tick = current_tick
@@ -193,6 +193,17 @@ class TileGrid:
             int(self.corner_y[sw]),
         )
 
+    def get_tile_corner_arrays(self, tile_idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get screen corners (NW, NE, SE, SW) for many tiles. Returns [n, 4] x and y arrays."""
+        tx = tile_idx // self.size_y
+        ty = tile_idx % self.size_y
+        sy1 = self.size_y + 1
+        corners = np.stack(
+            (tx * sy1 + ty, (tx + 1) * sy1 + ty, (tx + 1) * sy1 + (ty + 1), tx * sy1 + (ty + 1)),
+            axis=1,
+        )
+        return self.corner_x[corners], self.corner_y[corners]
+
     def get_tile_quad(self, tile_idx: int) -> "Quad":
         """Get Quad for tile at flat index."""
         from escape.types import Quad
@@ -200,6 +211,12 @@ class TileGrid:
         nw_x, nw_y, ne_x, ne_y, se_x, se_y, sw_x, sw_y = self.get_tile_corners(tile_idx)
         return Quad.from_coords([(nw_x, nw_y), (ne_x, ne_y), (se_x, se_y), (sw_x, sw_y)])
 
+    def get_tile_quads(self, tile_idx: np.ndarray) -> list["Quad"]:
+        """Get Quads for many tiles at flat indices."""
+        from escape.types import Quad
+
+        return Quad.from_arrays_batch(*self.get_tile_corner_arrays(tile_idx))
+
     def get_visible_indices(self, mask: np.ndarray | None = None, margin: int = 0) -> np.ndarray:
         """Get flat indices of visible tiles, optionally filtered by mask."""
         if margin == 0:
@@ -0,0 +1,121 @@
+"""Tests for GroundItemList filtering and sorting."""
+
+import random
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from escape.types.ground_item import GroundItem
+from escape.types.ground_item_list import GroundItemList
+from escape.types.packed_position import PackedPosition
+
+if TYPE_CHECKING:
+    from escape.client import Client
+
+NAMES = ["Bones", "Coins", "Big bones", "Dragon bones", "Feather"]
+
+
+@pytest.fixture
+def items():
+    """Provide ground items spread over a few tiles and every plane."""
+    rng = random.Random(7)
+    client = cast("Client", SimpleNamespace())
+    result = []
+    for i in range(200):
+        position = PackedPosition(
+            rng.randint(3195, 3205), rng.randint(3195, 3205), rng.randint(0, 3)
+        )
+        data = {
+            "id": rng.choice([526, 995, 532, 536, 314]),
+            "name": rng.choice(NAMES),
+            "quantity": rng.randint(1, 5),
+            "ownership": rng.randint(0, 3),
+            "index": i,
+        }
+        result.append(GroundItem(data=data, position=position, client=client))
+    return result
+
+
+def _ids(items) -> list[int]:
+    return [item.data["index"] for item in items]
+
+
+class TestGroundItemList:
+    """Test suite for GroundItemList, checked against plain list comprehensions."""
+
+    def test_filter_by_item_id(self, items):
+        """Test filtering by item ID."""
+        expected = [item for item in items if item.id == 526]
+        assert _ids(GroundItemList(items).filter_by_item(526)) == _ids(expected)
+
+    def test_filter_by_item_name(self, items):
+        """Test case-insensitive name filtering."""
+        expected = [item for item in items if "bones" in item.name.lower()]
+        assert _ids(GroundItemList(items).filter_by_item("BONES")) == _ids(expected)
+
+    def test_filter_ownership(self, items):
+        """Test the ownership filters."""
+        ground = GroundItemList(items)
+        assert _ids(ground.filter_by_ownership(2)) == _ids(i for i in items if i.ownership == 2)
+        assert _ids(ground.filter_yours()) == _ids(i for i in items if i.is_yours)
+        assert _ids(ground.filter_lootable()) == _ids(i for i in items if i.can_loot)
+
+    @pytest.mark.parametrize("plane", [0, 2, 3])
+    def test_filter_by_position(self, items, plane):
+        """Test exact tile filtering, including planes packed as negative signed ints."""
+        target = PackedPosition(3200, 3200, plane)
+        expected = [item for item in items if item.position == target]
+        result = GroundItemList(items).filter_by_position(3200, 3200, plane)
+        assert _ids(result) == _ids(expected)
+
+    @pytest.mark.parametrize("plane", [0, 3])
+    def test_filter_nearby(self, items, plane):
+        """Test radius filtering on one plane."""
+        center = PackedPosition(3200, 3200, plane)
+        expected = [item for item in items if item.position.is_nearby(center, 2)]
+        result = GroundItemList(items).filter_nearby(3200, 3200, plane, 2)
+        assert _ids(result) == _ids(expected)
+
+    def test_sort_by_distance(self, items):
+        """Test stable nearest-first sorting."""
+        center = PackedPosition(3200, 3200, 0)
+        expected = sorted(items, key=lambda item: item.position.distance_to(center))
+        assert _ids(GroundItemList(items).sort_by_distance(3200, 3200, 0)) == _ids(expected)
+
+    @pytest.mark.parametrize("reverse", [True, False])
+    def test_sort_by_quantity(self, items, reverse):
+        """Test quantity sorting keeps sorted()'s tie order."""
+        expected = sorted(items, key=lambda item: item.quantity, reverse=reverse)
+        result = GroundItemList(items).sort_by_quantity(reverse=reverse)
+        assert _ids(result) == _ids(expected)
+
+    def test_chained_filters(self, items):
+        """Test that chained predicates, column filters and sorts compose."""
+        expected = [
+            item
+            for item in items
+            if item.quantity > 2 and item.can_loot and "bones" in item.name.lower()
+        ]
+        expected = sorted(expected, key=lambda item: item.quantity, reverse=True)
+        result = (
+            GroundItemList(items)
+            .filter(lambda item: item.quantity > 2)
+            .filter_lootable()
+            .filter_by_item("bones")
+            .sort_by_quantity()
+        )
+        assert _ids(result) == _ids(expected)
+
+    def test_to_list_is_a_copy(self, items):
+        """Test that to_list does not expose the internal list."""
+        ground = GroundItemList(items)
+        ground.to_list().clear()
+        assert len(ground) == len(items)
+
+    def test_empty(self):
+        """Test filters and sorts on an empty list."""
+        ground = GroundItemList([])
+        assert ground.filter_by_item(526).is_empty()
+        assert ground.sort_by_distance(3200, 3200, 0).count() == 0
+        assert ground.first() is None
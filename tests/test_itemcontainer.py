@@ -0,0 +1,81 @@
+"""Tests for ItemContainer lookups."""
+
+import pytest
+
+from escape.types.item import Item
+from escape.types.itemcontainer import ItemContainer
+
+
+@pytest.fixture
+def container():
+    """Provide a container with empty slots, stacks and repeated items."""
+    container = ItemContainer(container_id=93, slot_count=6)
+    container.from_array(
+        [
+            {"id": 995, "name": "Coins", "stack": 500},
+            None,
+            {"id": 1511, "name": "Logs", "stack": 1},
+            {"id": 1521, "name": "Oak logs", "stack": 1},
+            {"id": 1511, "name": "Logs", "stack": 1},
+            None,
+        ]
+    )
+    return container
+
+
+class TestItemContainer:
+    """Test suite for ItemContainer id/name indexes."""
+
+    def test_lookup_by_id(self, container):
+        """Test ID lookups over repeated items."""
+        assert container.find_item_slot(1511) == 2
+        assert container.find_item_slots(1511) == [2, 4]
+        assert container.get_item_count(1511) == 2
+        assert container.get_item_quantity(995) == 500
+        assert [item.id for item in container.get_items(1511)] == [1511, 1511]
+        assert container.contains_item(1521)
+
+    def test_lookup_by_name(self, container):
+        """Test case-sensitive substring lookups across distinct names."""
+        assert container.find_item_slots("logs") == [3]
+        assert container.find_item_slots("Logs") == [2, 4]
+        assert container.find_item_slot("Oak") == 3
+        assert container.find_item_slot("OAK") is None
+        assert container.get_item_count("Logs") == 2
+        assert container.get_item_quantity("Logs") == 2
+        assert container.contains_item("Coin")
+        assert not container.contains_item("coin")
+        assert container.contains_all_items([995, "Oak logs"])
+
+    def test_missing_item(self, container):
+        """Test lookups for an item that isn't there."""
+        assert container.find_item_slot(4151) is None
+        assert container.find_item_slots("whip") == []
+        assert container.get_items(4151) == []
+        assert container.get_item_quantity("whip") == 0
+        assert not container.contains_item("whip")
+        assert not container.contains_all_items([995, 4151])
+
+    def test_totals(self, container):
+        """Test slot counts and quantities."""
+        assert container.get_total_count() == 4
+        assert container.get_total_quantity() == 503
+        assert not container.is_empty()
+        assert not container.is_full()
+
+    def test_results_are_copies(self, container):
+        """Test that returned slot lists don't alias the index."""
+        container.find_item_slots(1511).append(0)
+        assert container.find_item_slots(1511) == [2, 4]
+
+    def test_index_follows_new_items(self, container):
+        """Test that replacing the items list rebuilds the index."""
+        assert container.contains_item(995)
+        container.items = [Item(id=4151, name="Abyssal whip", quantity=1, noted=False)]
+        assert not container.contains_item(995)
+        assert container.find_item_slot("whip") == 0
+        assert container.get_total_count() == 1
+
+        container.clear()
+        assert container.is_empty()
+        assert container.get_total_quantity() == 0
@@ -0,0 +1,126 @@
+"""Tests for the context menu snapshot."""
+
+import importlib
+import types
+
+import pytest
+
+from escape.interactions.menu import Menu
+
+# The package re-exports the Menu instance as `menu`, shadowing the submodule attribute
+menu_module = importlib.import_module("escape.interactions.menu")
+
+
+class FakeCache:
+    """Event cache stand-in that serves a fixed menu event."""
+
+    def __init__(self):
+        self.menu_options: dict = {}
+        self.menu_open_state: dict = {}
+
+    def get_menu_options(self) -> dict:
+        return self.menu_options
+
+    def get_menu_open_state(self) -> dict:
+        return self.menu_open_state
+
+
+def _menu_event(timestamp: float) -> dict:
+    # Stored backwards: the last entry is the top (default) option
+    return {
+        "types": ["CANCEL", "WALK", "GAME_OBJECT_FIRST_OPTION"],
+        "options": ["Cancel", "Walk here", "Chop down"],
+        "targets": ["", "", "<col=ffff>Tree</col>"],
+        "_timestamp": timestamp,
+    }
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Point the menu at a fake event cache and reset its snapshot memo."""
+    cache = FakeCache()
+    monkeypatch.setattr(menu_module, "client", types.SimpleNamespace(cache=cache))
+    Menu()._init()
+    return cache
+
+
+@pytest.fixture
+def format_calls(monkeypatch):
+    """Count how often the menu snapshot is rebuilt."""
+    calls = []
+    original = Menu._format_options
+
+    def counting(self, data, strip_colors):
+        calls.append(strip_colors)
+        return original(self, data, strip_colors)
+
+    monkeypatch.setattr(Menu, "_format_options", counting)
+    return calls
+
+
+class TestMenu:
+    """Test suite for Menu option snapshots."""
+
+    def test_options_in_display_order(self, cache):
+        """Test that options are joined with targets, reversed and color-stripped."""
+        cache.menu_options = _menu_event(1.0)
+        menu = Menu()
+        assert menu.get_options() == ["Chop down Tree", "Walk here", "Cancel"]
+        assert menu.get_options(strip_colors=False) == [
+            "Chop down <col=ffff>Tree</col>",
+            "Walk here",
+            "Cancel",
+        ]
+        assert menu.get_types() == ["GAME_OBJECT_FIRST_OPTION", "WALK", "CANCEL"]
+        assert menu.get_left_click() == ("Chop down Tree", "GAME_OBJECT_FIRST_OPTION")
+
+    def test_queries_are_case_insensitive(self, cache):
+        """Test option and type matching."""
+        cache.menu_options = _menu_event(1.0)
+        menu = Menu()
+        assert menu.has_option("CHOP DOWN tree")
+        assert not menu.has_option("<col")
+        assert menu.has_option("<col", strip_colors=False)
+        assert menu.has_type("object_first")
+        assert not menu.has_type("npc")
+
+    def test_snapshot_reused_within_event(self, cache, format_calls):
+        """Test that polls of one menu event format the options once."""
+        cache.menu_options = _menu_event(1.0)
+        menu = Menu()
+        menu.get_options()
+        menu.has_option("walk")
+        menu.get_left_click_type()
+        assert format_calls == [True]
+
+    def test_snapshot_rebuilt_for_new_event(self, cache, format_calls):
+        """Test that a new menu event or color mode rebuilds the snapshot."""
+        cache.menu_options = _menu_event(1.0)
+        menu = Menu()
+        menu.get_options()
+        cache.menu_options = {
+            "types": ["CANCEL"],
+            "options": ["Cancel"],
+            "targets": [""],
+            "_timestamp": 2.0,
+        }
+        assert menu.get_options() == ["Cancel"]
+        assert not menu.has_option("walk")
+        menu.get_options(strip_colors=False)
+        assert format_calls == [True, True, False]
+
+    def test_returned_lists_are_copies(self, cache):
+        """Test that mutating a result doesn't affect the snapshot."""
+        cache.menu_options = _menu_event(1.0)
+        menu = Menu()
+        menu.get_options().append("Extra")
+        menu.get_types().clear()
+        assert menu.get_options() == ["Chop down Tree", "Walk here", "Cancel"]
+        assert menu.get_types() == ["GAME_OBJECT_FIRST_OPTION", "WALK", "CANCEL"]
+
+    def test_empty_menu(self, cache):
+        """Test queries when no menu event has been received."""
+        menu = Menu()
+        assert menu.get_options() == []
+        assert menu.get_left_click() == (None, None)
+        assert not menu.has_option("walk")
@@ -0,0 +1,201 @@
+"""Tests for the objects database preparation and accessors."""
+
+import sqlite3
+
+import pytest
+
+from escape._internal import cache_manager
+from escape._internal.resources import objects
+from escape.types.packed_position import pack_position_signed
+
+NAMES = [(1, "Oak tree"), (2, "Tree"), (3, "Bank booth"), (4, "Door")]
+
+# (object_id, name_id, x, y, plane)
+SPAWNS = [
+    (10, 1, 3200, 3200, 0),
+    (10, 1, 3203, 3201, 0),
+    (11, 2, 3201, 3200, 0),
+    (12, 3, 3195, 3198, 0),
+    (13, 4, 3210, 3200, 0),
+    (11, 2, 3200, 3200, 1),
+    (12, 3, 3202, 3202, 2),
+    (13, 4, 3199, 3203, 3),
+]
+
+# (object_id, slot, action)
+ACTIONS = [
+    (10, 0, "Chop down"),
+    (10, 4, "Examine"),
+    (11, 0, "Chop down"),
+    (12, 1, "Bank"),
+    (13, 0, "Open"),
+]
+
+
+def _make_connection() -> sqlite3.Connection:
+    """Build an in-memory copy of the downloaded objects database schema."""
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(
+        """
+        CREATE TABLE names(id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE objects(object_id INTEGER, name_id INTEGER, coord INTEGER);
+        CREATE TABLE object_action_slots(object_id INTEGER, slot INTEGER, action TEXT);
+        """
+    )
+    conn.executemany("INSERT INTO names VALUES (?, ?)", NAMES)
+    conn.executemany(
+        "INSERT INTO objects VALUES (?, ?, ?)",
+        [(oid, name_id, pack_position_signed(x, y, p)) for oid, name_id, x, y, p in SPAWNS],
+    )
+    conn.executemany("INSERT INTO object_action_slots VALUES (?, ?, ?)", ACTIONS)
+    return conn
+
+
+def _sqlite_supports(module_args: str) -> bool:
+    """Whether this SQLite build can create the given virtual table."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE probe USING {module_args}")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+HAS_RTREE = _sqlite_supports("rtree_i32(id, min_x, max_x)")
+HAS_FTS5_TRIGRAM = _sqlite_supports("fts5(name, tokenize='trigram')")
+
+
+@pytest.fixture
+def objects_db():
+    """Provide a prepared in-memory objects database wired into the accessors."""
+    conn = _make_connection()
+    cache_manager._prepare_objects_db(conn)
+    objects.set_db_connection(conn)
+    yield conn
+    objects.close()
+
+
+class TestPrepareObjectsDb:
+    """Test suite for the derived tables built by _prepare_objects_db."""
+
+    def test_builds_wide_tables(self, objects_db):
+        """Test that names are joined into objects_wide and actions are pivoted."""
+        rows = objects_db.execute(
+            "SELECT object_id, name FROM objects_wide WHERE object_id = 12"
+        ).fetchall()
+        assert rows == [(12, "Bank booth"), (12, "Bank booth")]
+
+        slots = objects_db.execute(
+            "SELECT slot0, slot1, slot2, slot3, slot4 FROM object_action_slots_wide "
+            "WHERE object_id = 10"
+        ).fetchone()
+        assert slots == ("Chop down", None, None, None, "Examine")
+
+    def test_sets_schema_version(self, objects_db):
+        """Test that the schema version is recorded after preparing."""
+        (version,) = objects_db.execute("PRAGMA user_version").fetchone()
+        assert version == cache_manager._OBJECTS_DB_SCHEMA
+
+    def test_schema_gate_skips_rebuild(self, objects_db):
+        """Test that an up-to-date database is not rebuilt."""
+        objects_db.execute("INSERT INTO objects VALUES (99, 1, 0)")
+        cache_manager._prepare_objects_db(objects_db)
+        count = objects_db.execute(
+            "SELECT COUNT(*) FROM objects_wide WHERE object_id = 99"
+        ).fetchone()[0]
+        assert count == 0
+
+    def test_outdated_schema_rebuilds(self, objects_db):
+        """Test that an older schema version rebuilds the derived tables."""
+        objects_db.execute("INSERT INTO objects VALUES (99, 1, 0)")
+        objects_db.execute("PRAGMA user_version = 0")
+        cache_manager._prepare_objects_db(objects_db)
+        count = objects_db.execute(
+            "SELECT COUNT(*) FROM objects_wide WHERE object_id = 99"
+        ).fetchone()[0]
+        assert count == 1
+
+
+class TestObjectsAccessors:
+    """Test suite for the objects resource accessors."""
+
+    def test_get_by_id(self, objects_db):
+        """Test lookup by object ID."""
+        assert objects.get_by_id(11) == {"id": 11, "name": "Tree"}
+        assert objects.get_by_id(404) is None
+
+    def test_get_by_name_exact(self, objects_db):
+        """Test exact name search."""
+        assert objects.get_by_name("Tree", exact=True) == [{"id": 11, "name": "Tree"}]
+
+    @pytest.mark.parametrize("has_fts", [True, False])
+    def test_get_by_name_substring(self, objects_db, monkeypatch, has_fts):
+        """Test substring name search through the trigram index and the LIKE fallback."""
+        if has_fts and not HAS_FTS5_TRIGRAM:
+            pytest.skip("SQLite built without fts5")
+        monkeypatch.setattr(objects, "_has_names_fts", has_fts)
+        results = objects.get_by_name("ree")
+        assert sorted(r["id"] for r in results) == [10, 11]
+
+    def test_get_locations(self, objects_db):
+        """Test that spawn coordinates are unpacked, including signed planes."""
+        assert sorted(objects.get_locations(12)) == [(3195, 3198, 0), (3202, 3202, 2)]
+
+    def test_search_by_action(self, objects_db):
+        """Test that action search returns every slot of the matching objects."""
+        results = sorted(objects.search_by_action("Chop down"), key=lambda r: r["id"])
+        assert results == [
+            {"id": 10, "name": "Oak tree", "actions": ["Chop down", None, None, None, "Examine"]},
+            {"id": 11, "name": "Tree", "actions": ["Chop down", None, None, None, None]},
+        ]
+
+    @pytest.mark.parametrize("has_rtree", [True, False])
+    def test_get_nearby_orders_by_distance(self, objects_db, monkeypatch, has_rtree):
+        """Test nearest-first ordering through the R-tree and the range-scan fallback."""
+        if has_rtree and not HAS_RTREE:
+            pytest.skip("SQLite built without rtree")
+        monkeypatch.setattr(objects, "_has_rtree", has_rtree)
+        results = objects.get_nearby(3200, 3200, plane=0, radius=5)
+        assert [(r["object_id"], r["distance"]) for r in results] == [
+            (10, 0),
+            (11, 1),
+            (10, 3),
+            (12, 5),
+        ]
+        assert results[0] == {
+            "object_id": 10,
+            "name": "Oak tree",
+            "x": 3200,
+            "y": 3200,
+            "plane": 0,
+            "distance": 0,
+        }
+
+    @pytest.mark.parametrize("has_rtree", [True, False])
+    def test_get_nearby_upper_plane(self, objects_db, monkeypatch, has_rtree):
+        """Test that planes stored as negative signed coords are still found."""
+        if has_rtree and not HAS_RTREE:
+            pytest.skip("SQLite built without rtree")
+        monkeypatch.setattr(objects, "_has_rtree", has_rtree)
+        results = objects.get_nearby(3200, 3200, plane=2, radius=5)
+        assert [(r["object_id"], r["x"], r["y"], r["plane"]) for r in results] == [
+            (12, 3202, 3202, 2)
+        ]
+
+    def test_get_nearby_limit(self, objects_db):
+        """Test that limit keeps only the nearest objects."""
+        results = objects.get_nearby(3200, 3200, plane=0, radius=5, limit=2)
+        assert [r["object_id"] for r in results] == [10, 11]
+
+    def test_counts(self, objects_db):
+        """Test object and location counts."""
+        assert objects.count_objects() == 4
+        assert objects.count_locations() == len(SPAWNS)
+
+    def test_not_loaded(self):
+        """Test that accessors return empty results without a database."""
+        objects.close()
+        assert objects.get_by_id(10) is None
+        assert objects.get_nearby(3200, 3200) == []
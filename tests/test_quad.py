@@ -0,0 +1,100 @@
+"""Tests for Quad geometry."""
+
+import random
+
+import numpy as np
+import pytest
+
+from escape.types.point import Point
+from escape.types.quad import Quad
+
+QUADS = {
+    "square": [(0, 0), (10, 0), (10, 10), (0, 10)],
+    "clockwise": [(0, 0), (0, 10), (10, 10), (10, 0)],
+    "skewed": [(2, 0), (14, 3), (11, 12), (-1, 9)],
+    "concave": [(0, 0), (10, 0), (4, 4), (0, 10)],
+    "repeated_vertex": [(0, 0), (10, 0), (10, 0), (0, 10)],
+    "collinear": [(0, 0), (5, 0), (10, 0), (5, 8)],
+    "flat": [(0, 0), (5, 0), (10, 0), (15, 0)],
+}
+
+
+def _grid(quad: Quad) -> tuple[np.ndarray, np.ndarray]:
+    """Every integer point of the quad's bounding box plus a margin."""
+    min_x, min_y, max_x, max_y = quad.bounds()
+    xs, ys = np.meshgrid(np.arange(min_x - 2, max_x + 3), np.arange(min_y - 2, max_y + 3))
+    return xs.ravel(), ys.ravel()
+
+
+class TestQuad:
+    """Test suite for Quad containment and derived geometry."""
+
+    @pytest.mark.parametrize("name", list(QUADS))
+    def test_contains_matches_triangle_test(self, name):
+        """Test that the convex edge test agrees with the two-triangle test."""
+        quad = Quad.from_coords(QUADS[name])
+        xs, ys = _grid(quad)
+        expected = quad.contains_batch(xs, ys).tolist()
+        actual = [quad.contains(Point(x, y)) for x, y in zip(xs.tolist(), ys.tolist(), strict=True)]
+        assert actual == expected
+
+    def test_contains_edges_and_outside(self):
+        """Test that edges and corners are inside and nearby points are not."""
+        quad = Quad.from_coords(QUADS["square"])
+        assert quad.contains(Point(0, 0))
+        assert quad.contains(Point(10, 5))
+        assert quad.contains(Point(5, 5))
+        assert not quad.contains(Point(11, 5))
+        assert not quad.contains(Point(5, -1))
+
+    def test_concave_notch_is_outside(self):
+        """Test that the notch of a concave quad is excluded."""
+        quad = Quad.from_coords(QUADS["concave"])
+        assert quad.contains(Point(1, 1))
+        assert not quad.contains(Point(8, 8))
+
+    @pytest.mark.parametrize(
+        ("name", "convex"),
+        [
+            ("square", True),
+            ("clockwise", True),
+            ("skewed", True),
+            ("concave", False),
+            ("repeated_vertex", True),
+            ("collinear", True),
+        ],
+    )
+    def test_is_convex(self, name, convex):
+        """Test convexity, which tolerates repeated and collinear vertices."""
+        assert Quad.from_coords(QUADS[name]).is_convex() is convex
+
+    def test_area_bounds_center(self):
+        """Test the precomputed area, bounds and center."""
+        quad = Quad.from_coords(QUADS["skewed"])
+        assert quad.bounds() == (-1, 0, 14, 12)
+        assert quad.area() == 117.0
+        assert quad.center() == Point(6, 6)
+        assert quad.center() is quad.center()
+
+    def test_random_point_inside(self):
+        """Test that random points land inside, including for concave quads."""
+        random.seed(3)
+        for name in ("square", "skewed", "concave"):
+            quad = Quad.from_coords(QUADS[name])
+            for _ in range(50):
+                assert quad.contains(quad.random_point())
+
+    def test_random_point_reproducible(self):
+        """Test that seeding random reproduces random_point."""
+        quad = Quad.from_coords(QUADS["concave"])
+        random.seed(11)
+        first = [quad.random_point() for _ in range(20)]
+        random.seed(11)
+        assert [quad.random_point() for _ in range(20)] == first
+
+    def test_from_arrays_batch(self):
+        """Test building one quad per row of coordinate arrays."""
+        xs = np.array([[0, 10, 10, 0], [2, 14, 11, -1]])
+        ys = np.array([[0, 0, 10, 10], [0, 3, 12, 9]])
+        quads = Quad.from_arrays_batch(xs, ys)
+        assert quads == [Quad.from_coords(QUADS["square"]), Quad.from_coords(QUADS["skewed"])]